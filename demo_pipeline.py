@@ -95,12 +95,12 @@ def demo_extract_transform():
         print("-" * 50)
         
         # Create visualizations (this will save files to output directory)
-        dashboard_path = create_netflix_dashboard(transformed_data)
+        dashboard_path, analysis_stats = create_netflix_dashboard(transformed_data, return_stats=True)
         if dashboard_path:
             print(f"[SUCCESS] Dashboard visualizations created in: {dashboard_path}")
         
-        # Generate analysis report
-        report_path = generate_analysis_report(transformed_data)
+        # Generate analysis report (reuses the dashboard statistics)
+        report_path = generate_analysis_report(transformed_data, stats=analysis_stats)
         if report_path:
             print(f"[SUCCESS] Analysis report created: {report_path}")
         
@@ -23,9 +23,10 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 LOGS_DIR = PROJECT_ROOT / "logs"
+CACHE_DIR = OUTPUT_DIR / "cache"
 
 # Cria diretórios se não existirem
-for directory in [DATA_DIR, OUTPUT_DIR, LOGS_DIR]:
+for directory in [DATA_DIR, OUTPUT_DIR, LOGS_DIR, CACHE_DIR]:
     directory.mkdir(exist_ok=True)
 
 # Parâmetros de conexão com banco de dados
@@ -40,6 +41,22 @@ DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NA
 NETFLIX_CSV_PATH = PROJECT_ROOT.parent / "netflix_titles.csv"
 TABLE_NAME = "netflix_titles"
 
+# Esquema explícito do CSV do Netflix (evita a passagem de inferência de tipos)
+NETFLIX_SCHEMA = {
+    'show_id': 'string[pyarrow]',
+    'type': 'category',
+    'title': 'string[pyarrow]',
+    'director': 'string[pyarrow]',
+    'cast': 'string[pyarrow]',
+    'country': 'string[pyarrow]',
+    'date_added': 'string[pyarrow]',
+    'release_year': 'Int16',  # Inteiro anulável: um ano em branco não interrompe a leitura
+    'rating': 'category',
+    'duration': 'string[pyarrow]',
+    'listed_in': 'string[pyarrow]',
+    'description': 'string[pyarrow]'
+}
+
 # Configuração da API (para uso futuro)
 API_URL = os.getenv("API_URL", "https://api.example.com/data")
 API_KEY = os.getenv("API_KEY", "sua_chave_api_aqui")
@@ -48,6 +65,17 @@ API_KEY = os.getenv("API_KEY", "sua_chave_api_aqui")
 TIMEOUT = 30  # Tempo limite para requisições da API em segundos
 RETRY_COUNT = 3  # Número de tentativas para requisições da API
 CHUNK_SIZE = 1000  # Tamanho do lote para operações de banco de dados
+CSV_CHUNK_SIZE = 100_000  # Linhas por bloco na leitura do CSV
+
+# Leitura rápida de CSV com PyArrow (opcional; pandas continua sendo o padrão)
+FAST_IO = os.getenv("FAST_IO", "false").lower() in ("1", "true", "yes")
+# Motor de leitura do CSV: "pandas", "pyarrow" ou "polars"
+CSV_ENGINE = os.getenv("NETFLIX_CSV_ENGINE", "pyarrow" if FAST_IO else "pandas").lower()
+# Cache Parquet do CSV lido, em CACHE_DIR, para reexecuções sem novo parse
+PARQUET_CACHE = os.getenv("PARQUET_CACHE", "true").lower() in ("1", "true", "yes")
+# Cópia em Parquet da tabela carregada, para leitores que não precisam do Postgres
+PARQUET_SINK = os.getenv("PARQUET_SINK", "true").lower() in ("1", "true", "yes")
+PARQUET_ROW_GROUP_SIZE = 200_000  # Linhas por row group no Parquet de saída
 
 # Configuração de logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -56,4 +84,7 @@ LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} |
 # Configurações de visualização
 FIGURE_SIZE = (12, 8)
 DPI = 300
-COLOR_PALETTE = "viridis"
\ No newline at end of file
+PNG_COMPRESS_LEVEL = 1  # Nível zlib dos PNGs (1 = codificação rápida, arquivos um pouco maiores)
+COLOR_PALETTE = "viridis"
+# Dashboard rápido: layout "constrained" e sem o recorte bbox_inches="tight"
+FAST_DASHBOARD = os.getenv("FAST_DASHBOARD", "false").lower() in ("1", "true", "yes")
\ No newline at end of file
@@ -1,9 +1,257 @@
+import os
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, Dict, Iterator, BinaryIO, List
 from utils import log_message, handle_error, log_success, validate_data, validate_netflix_data
-from config import NETFLIX_CSV_PATH, TIMEOUT, RETRY_COUNT
+from config import (NETFLIX_CSV_PATH, NETFLIX_SCHEMA, TIMEOUT, RETRY_COUNT, CSV_ENGINE,
+                    CSV_CHUNK_SIZE, PARQUET_CACHE, CACHE_DIR)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+except ImportError:  # PyArrow is optional; pandas remains the default reader
+    pa = None
+    pq = None
+    pacsv = None
+
+try:
+    import polars as pl
+except ImportError:  # Polars is optional as well
+    pl = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib JSON decoder used by requests
+    orjson = None
+
+# Shared HTTP session: keeps connections alive and retries with backoff
+_session = requests.Session()
+_retry_adapter = HTTPAdapter(
+    max_retries=Retry(total=RETRY_COUNT, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    pool_connections=4,
+    pool_maxsize=8
+)
+_session.mount('https://', _retry_adapter)
+_session.mount('http://', _retry_adapter)
+
+def _read_csv_arrow(source: BinaryIO, encoding: str = 'utf-8') -> pd.DataFrame:
+    """
+    Read a CSV file with PyArrow's multi-threaded reader.
+    
+    Columns are returned Arrow-backed (pd.ArrowDtype), so text columns are
+    stored as Arrow buffers instead of one Python object per cell.
+    
+    Parameters:
+    source (BinaryIO): Open binary handle of the CSV file.
+    encoding (str): Source file encoding.
+    
+    Returns:
+    pd.DataFrame: Arrow-backed DataFrame.
+    """
+    try:
+        table = pacsv.read_csv(
+            source,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20, encoding=encoding),
+            parse_options=pacsv.ParseOptions(delimiter=','),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+        )
+    except pa.ArrowInvalid as e:
+        # Surface invalid UTF-8 the same way pandas does so callers can retry
+        if 'UTF8' in str(e):
+            raise UnicodeDecodeError(encoding, b'', 0, 1, str(e))
+        raise
+    
+    # Columns that fail UTF-8 validation are silently inferred as binary
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        raise UnicodeDecodeError(encoding, b'', 0, 1, "invalid UTF-8 data")
+    
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+def _read_csv_polars(source: BinaryIO) -> pd.DataFrame:
+    """
+    Read a UTF-8 CSV file with Polars' multi-threaded reader.
+    
+    Parameters:
+    source (BinaryIO): Open binary handle of the CSV file.
+    
+    Returns:
+    pd.DataFrame: Arrow-backed DataFrame.
+    """
+    df = pl.read_csv(source, try_parse_dates=False)
+    return df.to_pandas(use_pyarrow_extension_array=True)
+
+def _iter_csv_chunks(source: Union[Path, BinaryIO], encoding: str = 'utf-8',
+                     schema: Optional[Dict[str, str]] = None,
+                     chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Lazily read a CSV file with pandas in chunks of chunk_size rows.
+    
+    Parameters:
+    source (Path or BinaryIO): Path or open binary handle of the CSV file.
+    encoding (str): Source file encoding.
+    schema (Dict, optional): Column -> dtype map; see _read_csv.
+    chunk_size (int): Number of rows per chunk.
+    
+    Returns:
+    Iterator[pd.DataFrame]: Chunks of the CSV file.
+    """
+    # memory_map lets the C parser read straight from the page cache
+    if schema is None:
+        return pd.read_csv(source, encoding=encoding, chunksize=chunk_size, memory_map=True)
+    
+    # dtype/usecols are applied by the C parser while tokenizing
+    return pd.read_csv(source, encoding=encoding, chunksize=chunk_size, memory_map=True,
+                       dtype=schema, usecols=lambda col: col in schema)
+
+def _read_csv(source: BinaryIO, encoding: str = 'utf-8',
+              schema: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Read a CSV file with the engine selected by NETFLIX_CSV_ENGINE.
+    
+    'pyarrow' and 'polars' are opt-in fast paths; any failure falls back to
+    pandas, which remains the default engine.
+    
+    Parameters:
+    source (BinaryIO): Open binary handle of the CSV file; read from the start.
+    encoding (str): Source file encoding.
+    schema (Dict, optional): Column -> dtype map for the pandas reader. Only
+                             the listed columns are read and no type
+                             inference pass is made.
+    
+    Returns:
+    pd.DataFrame: Data read from the CSV file.
+    """
+    if CSV_ENGINE == 'pyarrow' and pacsv is not None:
+        try:
+            source.seek(0)
+            return _read_csv_arrow(source, encoding)
+        except UnicodeDecodeError:
+            raise
+        except Exception as e:
+            log_message(f"PyArrow CSV reader failed, falling back to pandas: {e}")
+    elif CSV_ENGINE == 'polars' and pl is not None and encoding == 'utf-8':
+        # Polars only decodes UTF-8; other encodings go straight to pandas
+        try:
+            source.seek(0)
+            return _read_csv_polars(source)
+        except Exception as e:
+            log_message(f"Polars CSV reader failed, falling back to pandas: {e}")
+    
+    # Chunked read keeps the parser's working memory bounded
+    source.seek(0)
+    df = pd.concat(_iter_csv_chunks(source, encoding, schema), ignore_index=True, copy=False)
+    
+    # Each chunk infers its own categories, so concat can fall back to object
+    if schema is not None:
+        category_columns = [col for col, dtype in schema.items()
+                            if dtype == 'category' and col in df.columns and df[col].dtype != 'category']
+        if category_columns:
+            df[category_columns] = df[category_columns].astype('category')
+    
+    return df
+
+# Parquet schema metadata entry holding the key of the CSV a cache was built from
+_CACHE_KEY_METADATA = b'netflix_csv_cache_key'
+
+def _parquet_cache_path(file_path: Path) -> Path:
+    """
+    Location of the Parquet cache of a CSV file under CACHE_DIR.
+    
+    Parameters:
+    file_path (Path): Path to the source CSV file.
+    
+    Returns:
+    Path: Cache file, unique per source path.
+    """
+    path_hash = hashlib.sha1(str(file_path.resolve()).encode('utf-8')).hexdigest()[:12]
+    return CACHE_DIR / f"{file_path.stem}-{path_hash}.parquet"
+
+def _parquet_cache_key(source_stat: os.stat_result, schema: Optional[Dict[str, str]]) -> bytes:
+    """
+    Key identifying the parsed result of a CSV file.
+    
+    A copy that keeps an older mtime still changes the size or mtime_ns, and
+    a different engine or schema parses the same file differently.
+    
+    Parameters:
+    source_stat (os.stat_result): Stat of the open CSV file.
+    schema (Dict, optional): Column -> dtype map used to parse it.
+    
+    Returns:
+    bytes: Hex digest of the file size, mtime, CSV engine and schema.
+    """
+    schema_items = sorted(schema.items()) if schema else None
+    key = f"{source_stat.st_size}:{source_stat.st_mtime_ns}:{CSV_ENGINE}:{schema_items}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest().encode('ascii')
+
+def _load_parquet_cache(file_path: Path, cache_key: bytes,
+                        schema: Optional[Dict[str, str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Load the Parquet cache of a CSV file if it was built from the same file and settings.
+    
+    Parameters:
+    file_path (Path): Path to the source CSV file.
+    cache_key (bytes): Key of the CSV file, from _parquet_cache_key.
+    schema (Dict, optional): Column -> dtype map the CSV was parsed with.
+    
+    Returns:
+    pd.DataFrame: Cached data, or None if there is no up-to-date cache.
+    """
+    cache_path = _parquet_cache_path(file_path)
+    
+    if not PARQUET_CACHE or pa is None or not cache_path.exists():
+        return None
+    
+    try:
+        # Only the footer is read to check the key
+        metadata = pq.read_schema(cache_path).metadata or {}
+        if metadata.get(_CACHE_KEY_METADATA) != cache_key:
+            log_message(f"Parquet cache does not match {file_path.name}, re-parsing CSV")
+            return None
+        
+        df = pd.read_parquet(cache_path, engine='pyarrow')
+        
+        # Parquet keeps the "string" dtype but not its storage; restore Arrow-backed strings
+        if schema:
+            restore = {col: dtype for col, dtype in schema.items()
+                       if dtype == 'string[pyarrow]' and col in df.columns and df[col].dtype == 'string[python]'}
+            if restore:
+                df = df.astype(restore)
+        
+        log_message(f"Loaded cached data from: {cache_path}")
+        return df
+    except Exception as e:
+        log_message(f"Could not read Parquet cache {cache_path}: {e}")
+        return None
+
+def _save_parquet_cache(df: pd.DataFrame, file_path: Path, cache_key: bytes) -> None:
+    """
+    Write df as the Parquet cache of its source CSV file.
+    
+    Parameters:
+    df (pd.DataFrame): Validated data parsed from the CSV file.
+    file_path (Path): Path to the source CSV file.
+    cache_key (bytes): Key of the CSV file, stored in the Parquet metadata.
+    """
+    if not PARQUET_CACHE or pa is None:
+        return
+    
+    cache_path = _parquet_cache_path(file_path)
+    
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _CACHE_KEY_METADATA: cache_key})
+        pq.write_table(table, cache_path, compression='zstd')
+        log_message(f"Parquet cache written: {cache_path}")
+    except Exception as e:
+        # The cache is only an optimization; a read-only output dir is fine
+        log_message(f"Could not write Parquet cache {cache_path}: {e}")
 
 def extract_netflix_data(file_path: Optional[Union[str, Path]] = None) -> Optional[pd.DataFrame]:
     """
@@ -21,15 +269,27 @@ def extract_netflix_data(file_path: Optional[Union[str, Path]] = None) -> Option
     
     file_path = Path(file_path)
     
-    if not file_path.exists():
+    # The schema uses Arrow-backed strings, so it needs PyArrow installed
+    schema = NETFLIX_SCHEMA if pa is not None else None
+    
+    # A single open() both checks existence and gives the readers a handle
+    try:
+        fh = open(file_path, 'rb')
+    except FileNotFoundError:
         handle_error(f"Netflix data file not found: {file_path}")
         return None
     
     try:
         log_message(f"Starting extraction from: {file_path}")
         
-        # Read CSV with proper encoding handling
-        df = pd.read_csv(file_path, encoding='utf-8')
+        # Reuse the parsed data from a previous run when the CSV is unchanged
+        cache_key = _parquet_cache_key(os.fstat(fh.fileno()), schema)
+        df = _load_parquet_cache(file_path, cache_key, schema)
+        from_cache = df is not None
+        
+        if not from_cache:
+            # Read CSV with proper encoding handling
+            df = _read_csv(fh, encoding='utf-8', schema=schema)
         
         # Basic validation
         if not validate_data(df):
@@ -39,6 +299,9 @@ def extract_netflix_data(file_path: Optional[Union[str, Path]] = None) -> Option
         if not validate_netflix_data(df):
             return None
         
+        if not from_cache:
+            _save_parquet_cache(df, file_path, cache_key)
+        
         log_success(f"Successfully extracted {len(df)} Netflix titles from {file_path.name}")
         log_message(f"Data shape: {df.shape}")
         log_message(f"Columns: {list(df.columns)}")
@@ -49,7 +312,13 @@ def extract_netflix_data(file_path: Optional[Union[str, Path]] = None) -> Option
         try:
             # Try different encoding
             log_message("Trying alternative encoding (latin-1)")
-            df = pd.read_csv(file_path, encoding='latin-1')
+            df = _read_csv(fh, encoding='latin-1', schema=schema)
+            
+            # Validated like the UTF-8 path, so an invalid file is never cached
+            if not validate_data(df) or not validate_netflix_data(df):
+                return None
+            
+            _save_parquet_cache(df, file_path, cache_key)
             log_success(f"Successfully extracted with latin-1 encoding: {len(df)} records")
             return df
         except Exception as e:
@@ -58,6 +327,116 @@ def extract_netflix_data(file_path: Optional[Union[str, Path]] = None) -> Option
     except Exception as e:
         handle_error(f"Error extracting Netflix data from {file_path}: {e}")
         return None
+    finally:
+        fh.close()
+
+def extract_netflix_arrow(file_path: Optional[Union[str, Path]] = None) -> Optional["pa.Table"]:
+    """
+    Extracts Netflix data from a memory-mapped CSV file as an Arrow Table.
+    
+    Text is kept in Arrow buffers, so converting with
+    table.to_pandas(types_mapper=pd.ArrowDtype) avoids creating one Python
+    object per cell. Only UTF-8 files are supported; use extract_netflix_data
+    for other encodings.
+    
+    Parameters:
+    file_path (str or Path, optional): Path to the Netflix CSV file. 
+                                      Defaults to config.NETFLIX_CSV_PATH.
+    
+    Returns:
+    pa.Table: Raw Netflix data, or None if it could not be read.
+    """
+    if pa is None:
+        handle_error("PyArrow is required for Arrow extraction")
+        return None
+    
+    if file_path is None:
+        file_path = NETFLIX_CSV_PATH
+    
+    file_path = Path(file_path)
+    
+    try:
+        log_message(f"Starting Arrow extraction from: {file_path}")
+        
+        with pa.memory_map(str(file_path), 'r') as source:
+            table = pacsv.read_csv(
+                source,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+                convert_options=pacsv.ConvertOptions(
+                    strings_can_be_null=True,
+                    null_values=['', 'nan', 'None']
+                )
+            )
+        
+        # Columns that fail UTF-8 validation are silently inferred as binary
+        if any(pa.types.is_binary(field.type) for field in table.schema):
+            handle_error(f"File is not valid UTF-8, use extract_netflix_data instead: {file_path}")
+            return None
+        
+        if table.num_rows == 0:
+            handle_error("Dados estão vazios")
+            return None
+        
+        # Netflix-specific validation only needs the column names
+        if not validate_netflix_data(table.schema.empty_table().to_pandas()):
+            return None
+        
+        log_success(f"Successfully extracted {table.num_rows} Netflix titles from {file_path.name}")
+        return table
+        
+    except FileNotFoundError:
+        handle_error(f"Netflix data file not found: {file_path}")
+        return None
+    except Exception as e:
+        handle_error(f"Error extracting Netflix data from {file_path}: {e}")
+        return None
+
+def iter_netflix_data(file_path: Optional[Union[str, Path]] = None,
+                      chunk_size: int = CSV_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Stream Netflix data from the CSV file in chunks without materializing it.
+    
+    A read error after the first chunk has been yielded is re-raised, so a
+    failure partway through the file is never mistaken for its end.
+    
+    Parameters:
+    file_path (str or Path, optional): Path to the UTF-8 Netflix CSV file.
+                                      Defaults to config.NETFLIX_CSV_PATH.
+    chunk_size (int): Number of rows per chunk.
+    
+    Returns:
+    Iterator[pd.DataFrame]: Raw Netflix data, chunk_size rows at a time.
+    """
+    if file_path is None:
+        file_path = NETFLIX_CSV_PATH
+    
+    file_path = Path(file_path)
+    schema = NETFLIX_SCHEMA if pa is not None else None
+    
+    try:
+        fh = open(file_path, 'rb')
+    except FileNotFoundError:
+        handle_error(f"Netflix data file not found: {file_path}")
+        return
+    
+    chunks_read = 0
+    try:
+        log_message(f"Streaming {file_path} in chunks of {chunk_size} rows")
+        
+        for chunk in _iter_csv_chunks(fh, 'utf-8', schema, chunk_size):
+            # Columns are the same for every chunk, so validate only once
+            if chunks_read == 0 and not validate_netflix_data(chunk):
+                return
+            chunks_read += 1
+            yield chunk
+            
+    except Exception as e:
+        handle_error(f"Error streaming Netflix data from {file_path}: {e}")
+        # The caller already consumed earlier chunks; ending quietly would truncate the data
+        if chunks_read:
+            raise
+    finally:
+        fh.close()
 
 def extract_data(source_type: str, source: str) -> Optional[pd.DataFrame]:
     """
@@ -86,39 +465,41 @@ def extract_from_api(api_url: str) -> Optional[pd.DataFrame]:
     """
     Extract data from API with retry logic and proper error handling.
     
+    Requests go through a shared keep-alive session whose adapter retries
+    failed requests with exponential backoff.
+    
     Parameters:
     api_url (str): URL of the API endpoint.
     
     Returns:
     pd.DataFrame: Data extracted from the API.
     """
-    for attempt in range(RETRY_COUNT):
-        try:
-            log_message(f"API request attempt {attempt + 1}/{RETRY_COUNT}: {api_url}")
-            
-            response = requests.get(api_url, timeout=TIMEOUT)
-            response.raise_for_status()
-            
-            data = response.json()
-            df = pd.DataFrame(data)
+    try:
+        log_message(f"API request (up to {RETRY_COUNT} retries): {api_url}")
+        
+        response = _session.get(api_url, timeout=TIMEOUT)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+        df = pd.DataFrame.from_records(data)
+        
+        if validate_data(df):
+            log_success(f"Successfully extracted {len(df)} records from API")
+            return df
+        else:
+            handle_error("API returned invalid data")
+            return None
             
-            if validate_data(df):
-                log_success(f"Successfully extracted {len(df)} records from API")
-                return df
-            else:
-                handle_error("API returned invalid data")
-                return None
-                
-        except requests.exceptions.Timeout:
-            handle_error(f"API request timeout (attempt {attempt + 1})")
-        except requests.exceptions.RequestException as e:
-            handle_error(f"API request failed (attempt {attempt + 1}): {e}")
-        except ValueError as e:
-            handle_error(f"Invalid JSON response (attempt {attempt + 1}): {e}")
-        except Exception as e:
-            handle_error(f"Unexpected error during API extraction (attempt {attempt + 1}): {e}")
+    except requests.exceptions.Timeout:
+        handle_error(f"API request timeout after {RETRY_COUNT} retries")
+    except requests.exceptions.RequestException as e:
+        handle_error(f"API request failed after {RETRY_COUNT} retries: {e}")
+    except ValueError as e:
+        handle_error(f"Invalid JSON response: {e}")
+    except Exception as e:
+        handle_error(f"Unexpected error during API extraction: {e}")
     
-    handle_error(f"Failed to extract data from API after {RETRY_COUNT} attempts")
+    handle_error("Failed to extract data from API")
     return None
 
 def extract_csv(file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
@@ -133,7 +514,9 @@ def extract_csv(file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
     """
     file_path = Path(file_path)
     
-    if not file_path.exists():
+    try:
+        fh = open(file_path, 'rb')
+    except FileNotFoundError:
         handle_error(f"CSV file not found: {file_path}")
         return None
     
@@ -141,7 +524,7 @@ def extract_csv(file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
         log_message(f"Extracting data from CSV: {file_path}")
         
         # Try UTF-8 first
-        df = pd.read_csv(file_path, encoding='utf-8')
+        df = _read_csv(fh, encoding='utf-8')
         
         if validate_data(df):
             log_success(f"Successfully extracted {len(df)} records from {file_path.name}")
@@ -153,7 +536,7 @@ def extract_csv(file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
         try:
             # Fallback to latin-1
             log_message("Trying latin-1 encoding")
-            df = pd.read_csv(file_path, encoding='latin-1')
+            df = _read_csv(fh, encoding='latin-1')
             
             if validate_data(df):
                 log_success(f"Successfully extracted {len(df)} records with latin-1 encoding")
@@ -166,4 +549,48 @@ def extract_csv(file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
             return None
     except Exception as e:
         handle_error(f"Error extracting data from {file_path}: {e}")
-        return None
\ No newline at end of file
+        return None
+    finally:
+        fh.close()
+
+def extract_many(file_paths: List[Union[str, Path]]) -> Optional[pd.DataFrame]:
+    """
+    Extract several CSV files (e.g. sharded exports) in parallel and combine them.
+    
+    Parameters:
+    file_paths (List[str or Path]): Paths to the CSV files.
+    
+    Returns:
+    pd.DataFrame: Rows of all files, in the order the files were given.
+    """
+    paths = [Path(file_path) for file_path in file_paths]
+    
+    if not paths:
+        handle_error("No CSV files given for extraction")
+        return None
+    
+    try:
+        log_message(f"Extracting {len(paths)} CSV files in parallel")
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            if pacsv is not None:
+                # PyArrow's CSV reader releases the GIL, so threads parse files concurrently
+                convert_options = pacsv.ConvertOptions(strings_can_be_null=True)
+                tables = list(executor.map(
+                    lambda path: pacsv.read_csv(str(path), convert_options=convert_options), paths))
+                df = pa.concat_tables(tables, promote=True).to_pandas()
+            else:
+                df = pd.concat(executor.map(pd.read_csv, paths), ignore_index=True)
+        
+        if validate_data(df):
+            log_success(f"Successfully extracted {len(df)} records from {len(paths)} files")
+            return df
+        else:
+            return None
+            
+    except FileNotFoundError as e:
+        handle_error(f"CSV file not found: {e.filename or e}")
+        return None
+    except Exception as e:
+        handle_error(f"Error extracting data from {len(paths)} CSV files: {e}")
+        return None
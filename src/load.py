@@ -1,17 +1,83 @@
+import io
+import functools
 import pandas as pd
 import numpy as np
 from sqlalchemy import create_engine, text, MetaData, Table, inspect
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Optional, Dict, Any
+from psycopg2 import sql
+from typing import Optional, Dict, Any, Tuple, List
 from pathlib import Path
-from config import DATABASE_URL, TABLE_NAME, CHUNK_SIZE, OUTPUT_DIR
+from config import (
+    DATABASE_URL, TABLE_NAME, CHUNK_SIZE, OUTPUT_DIR,
+    PARQUET_SINK, PARQUET_ROW_GROUP_SIZE
+)
 from utils import log_message, handle_error, log_success, get_data_quality_report
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module for reports
+    orjson = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # PyArrow is optional; the Parquet sink is skipped without it
+    pq = None
+
+@functools.lru_cache(maxsize=4)
+def _get_engine(db_url: str) -> Engine:
+    """
+    Return a pooled engine for db_url, shared by all helpers in this module.
+    
+    Parameters:
+    db_url (str): Database connection URL
+    
+    Returns:
+    Engine: Cached SQLAlchemy engine
+    """
+    return create_engine(
+        db_url,
+        pool_pre_ping=True,
+        pool_size=8,
+        max_overflow=4,
+        executemany_mode='values_plus_batch'
+    )
+
+class _DataFrameCopyReader:
+    """
+    File-like object that renders a DataFrame as CSV lazily for COPY.
+    
+    Only chunk_size rows are serialized at a time, so the extra memory used
+    by a load is bounded by one chunk instead of the whole DataFrame.
+    """
+    
+    def __init__(self, df: pd.DataFrame, chunk_size: int = CHUNK_SIZE):
+        self._df = df
+        self._chunk_size = chunk_size
+        self._position = 0
+        self._buffer = io.StringIO()
+    
+    def _next_chunk(self) -> str:
+        chunk = self._df.iloc[self._position:self._position + self._chunk_size]
+        self._position += self._chunk_size
+        return chunk.to_csv(index=False, header=False, na_rep='\\N')
+    
+    def read(self, size: int = -1) -> str:
+        if size is None or size < 0:
+            return ''.join(iter(lambda: self.read(1 << 16), ''))
+        
+        data = self._buffer.read(size)
+        while not data and self._position < len(self._df):
+            self._buffer = io.StringIO(self._next_chunk())
+            data = self._buffer.read(size)
+        return data
+
 def load_to_postgres(df: pd.DataFrame, 
                     table_name: str = TABLE_NAME, 
                     db_url: str = DATABASE_URL,
                     if_exists: str = 'replace',
-                    chunk_size: int = CHUNK_SIZE) -> bool:
+                    chunk_size: int = CHUNK_SIZE,
+                    write_outputs: bool = True) -> bool:
     """
     Load DataFrame to PostgreSQL database with comprehensive error handling.
     
@@ -20,7 +86,9 @@ def load_to_postgres(df: pd.DataFrame,
     table_name (str): Target table name
     db_url (str): Database connection URL
     if_exists (str): How to behave if table exists ('fail', 'replace', 'append')
-    chunk_size (int): Number of rows to insert at a time
+    chunk_size (int): Number of rows serialized for COPY at a time
+    write_outputs (bool): Save the load report and Parquet copy; disable when
+                          loading a table piece by piece
     
     Returns:
     bool: True if successful, False otherwise
@@ -33,39 +101,49 @@ def load_to_postgres(df: pd.DataFrame,
         log_message(f"Starting data load to PostgreSQL table: {table_name}")
         log_message(f"Data shape: {df.shape}")
         
-        # Create database engine
-        engine = create_engine(db_url)
-        
-        # Test connection
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-            log_message("Database connection successful")
+        # Reuse the pooled engine for this database
+        engine = _get_engine(db_url)
         
         # Prepare data for loading
-        df_to_load = prepare_data_for_db(df)
+        # The stats only feed the load report, so per-chunk loads skip the extra scans
+        df_to_load, quality_stats = prepare_data_for_db(df, with_stats=write_outputs)
         
-        # Load data in chunks for better performance
-        log_message(f"Loading {len(df_to_load)} rows in chunks of {chunk_size}")
+        # Bulk load with COPY instead of row-wise INSERT statements
+        log_message(f"Loading {len(df_to_load)} rows with COPY")
         
-        df_to_load.to_sql(
-            name=table_name,
-            con=engine,
-            if_exists=if_exists,
-            index=False,
-            chunksize=chunk_size,
-            method='multi'  # Use multi-row INSERT statements
-        )
-        
-        # Verify the load
-        with engine.connect() as conn:
-            result = conn.execute(text(f"SELECT COUNT(*) FROM {table_name}"))
-            row_count = result.scalar()
+        with engine.begin() as conn:
+            # Create the table from the DataFrame schema without inserting rows
+            df_to_load.head(0).to_sql(
+                name=table_name,
+                con=conn,
+                if_exists=if_exists,
+                index=False
+            )
+            
+            # Rows are serialized while COPY consumes them, one chunk at a time
+            reader = _DataFrameCopyReader(df_to_load, chunk_size)
+            
+            # Columns are named so an appended table with another column order still lines up
+            copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')").format(
+                sql.Identifier(table_name),
+                sql.SQL(', ').join(sql.Identifier(col) for col in df_to_load.columns)
+            )
             
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(copy_sql, reader)
+                
+                # The server reports the copied row count, no need to re-count the table
+                row_count = cursor.rowcount if cursor.rowcount >= 0 else len(df_to_load)
+        
         log_success(f"Successfully loaded {row_count} rows to table {table_name}")
         
-        # Generate and save load report
-        load_report = generate_load_report(df_to_load, table_name, row_count)
-        save_load_report(load_report)
+        if write_outputs:
+            # Columnar copy for readers that don't need to go through Postgres
+            save_to_parquet(df_to_load, table_name)
+            
+            # Generate and save load report
+            load_report = generate_load_report(df_to_load, table_name, row_count, quality_stats)
+            save_load_report(load_report)
         
         return True
         
@@ -75,59 +153,97 @@ def load_to_postgres(df: pd.DataFrame,
     except Exception as e:
         handle_error(f"Unexpected error during load: {e}")
         return False
-    finally:
-        # Clean up engine
-        if 'engine' in locals():
-            engine.dispose()
 
-def prepare_data_for_db(df: pd.DataFrame) -> pd.DataFrame:
+def _clean_series(series: pd.Series) -> pd.Series:
+    """
+    Make a column safe for PostgreSQL, returning it untouched when possible.
+    
+    Parameters:
+    series (pd.Series): Column to clean
+    
+    Returns:
+    pd.Series: Cleaned column, or the same object if nothing had to change
+    """
+    dtype = series.dtype
+    
+    # Boolean columns - convert to nullable boolean
+    if dtype == bool:
+        return series.astype('boolean')
+    
+    # Categorical and object columns - replace NaN with None for PostgreSQL
+    if isinstance(dtype, pd.CategoricalDtype) or dtype == object:
+        if dtype != object:
+            series = series.astype(object)
+        return series.where(series.notna(), None) if series.hasnans else series
+    
+    # Float columns are handled as a single block in prepare_data_for_db;
+    # datetime columns need no handling: NaT is already written as NULL
+    return series
+
+def _replace_infinite(df: pd.DataFrame, cleaned: Dict[str, pd.Series]) -> None:
+    """
+    Replace inf and -inf with NaN in all float columns using one 2D pass.
+    
+    Parameters:
+    df (pd.DataFrame): Input DataFrame
+    cleaned (Dict[str, pd.Series]): Cleaned columns, updated in place
+    """
+    float_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_float_dtype(dtype)]
+    if not float_cols:
+        return
+    
+    values = df[float_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    infinite = np.isinf(values)
+    if not infinite.any():
+        return
+    
+    values[infinite] = np.nan
+    # Only the columns that actually held inf values are rebuilt
+    for i in np.flatnonzero(infinite.any(axis=0)):
+        col = float_cols[i]
+        cleaned[col] = pd.Series(values[:, i], index=df.index, name=col)
+
+def prepare_data_for_db(df: pd.DataFrame,
+                        with_stats: bool = True) -> Tuple[pd.DataFrame, Optional[Dict[str, Any]]]:
     """
     Prepare DataFrame for database loading by handling data types and NaN values.
     
+    Columns that need no cleaning are passed through by reference instead of
+    copying the whole frame.
+    
     Parameters:
     df (pd.DataFrame): Input DataFrame
+    with_stats (bool): Also gather the data quality stats of the load report
     
     Returns:
-    pd.DataFrame: Prepared DataFrame
+    Tuple[pd.DataFrame, Dict]: Prepared DataFrame and its data quality stats,
+                               None when with_stats is False
     """
     log_message("Preparing data for database loading")
     
-    df_prepared = df.copy()
-    
-    # Handle datetime columns
-    datetime_columns = df_prepared.select_dtypes(include=['datetime64']).columns
-    for col in datetime_columns:
-        # Convert NaT to None for PostgreSQL compatibility
-        df_prepared[col] = df_prepared[col].where(pd.notna(df_prepared[col]), None)
-    
-    # Handle boolean columns
-    boolean_columns = df_prepared.select_dtypes(include=['bool']).columns
-    for col in boolean_columns:
-        # Convert to nullable boolean
-        df_prepared[col] = df_prepared[col].astype('boolean')
-    
-    # Handle categorical columns
-    categorical_columns = df_prepared.select_dtypes(include=['category']).columns
-    for col in categorical_columns:
-        # Convert categories to strings
-        df_prepared[col] = df_prepared[col].astype(str)
-        df_prepared[col] = df_prepared[col].replace('nan', None)
-    
-    # Handle object columns (strings)
-    object_columns = df_prepared.select_dtypes(include=['object']).columns
-    for col in object_columns:
-        # Replace NaN with None for PostgreSQL
-        df_prepared[col] = df_prepared[col].where(pd.notna(df_prepared[col]), None)
-    
-    # Handle numeric columns
-    numeric_columns = df_prepared.select_dtypes(include=[np.number]).columns
-    for col in numeric_columns:
-        # Replace inf and -inf with NaN, then with None
-        df_prepared[col] = df_prepared[col].replace([np.inf, -np.inf], np.nan)
-        df_prepared[col] = df_prepared[col].where(pd.notna(df_prepared[col]), None)
+    cleaned = {col: _clean_series(series) for col, series in df.items()}
+    _replace_infinite(df, cleaned)
+    df_prepared = pd.DataFrame(cleaned, copy=False)
+    
+    if not with_stats:
+        log_message("Data preparation completed")
+        return df_prepared, None
+    
+    # Quality stats gathered here so the load report doesn't re-scan the frame
+    quality_stats = {
+        'total_linhas': len(df_prepared),
+        'total_colunas': len(df_prepared.columns),
+        'valores_ausentes': df_prepared.isna().sum().to_dict(),
+        # Same fields and meaning as get_data_quality_report, which the load report used before
+        'linhas_duplicadas': int(df_prepared.duplicated().sum()),
+        'tipos_de_dados': {col: str(dtype) for col, dtype in df_prepared.dtypes.items()},
+        'uso_de_memoria': int(df_prepared.memory_usage(deep=True).sum()),
+        'colunas_numericas': df_prepared.select_dtypes(include=[np.number]).columns.tolist(),
+        'colunas_categoricas': df_prepared.select_dtypes(include=['object']).columns.tolist()
+    }
     
     log_message("Data preparation completed")
-    return df_prepared
+    return df_prepared, quality_stats
 
 def create_database_schema(db_url: str = DATABASE_URL) -> bool:
     """
@@ -140,14 +256,23 @@ def create_database_schema(db_url: str = DATABASE_URL) -> bool:
     bool: True if successful, False otherwise
     """
     try:
-        engine = create_engine(db_url)
-        
         # Extract database name from URL
-        db_name = db_url.split('/')[-1]
+        url = make_url(db_url)
+        db_name = url.database
         
-        # Create database if it doesn't exist
-        with engine.connect() as conn:
-            conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {db_name}"))
+        # CREATE DATABASE can't run inside a transaction, so check and create
+        # through an AUTOCOMMIT connection to the maintenance database
+        maintenance_url = url.set(database='postgres').render_as_string(hide_password=False)
+        with _get_engine(maintenance_url).connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_catalog.pg_database WHERE datname = :name"),
+                {'name': db_name}
+            ).scalar()
+            
+            if not exists:
+                quoted_name = db_name.replace('"', '""')
+                conn.execute(text(f'CREATE DATABASE "{quoted_name}"'))
+                log_message(f"Database created: {db_name}")
             
         log_success(f"Database schema ensured: {db_name}")
         return True
@@ -155,9 +280,59 @@ def create_database_schema(db_url: str = DATABASE_URL) -> bool:
     except Exception as e:
         handle_error(f"Error creating database schema: {e}")
         return False
-    finally:
-        if 'engine' in locals():
-            engine.dispose()
+
+def replace_table(staging_table: str, table_name: str = TABLE_NAME,
+                  db_url: str = DATABASE_URL) -> bool:
+    """
+    Swap a fully loaded staging table in place of table_name in one transaction.
+    
+    Parameters:
+    staging_table (str): Table holding the new data
+    table_name (str): Table to replace
+    db_url (str): Database connection URL
+    
+    Returns:
+    bool: True if successful, False otherwise
+    """
+    try:
+        engine = _get_engine(db_url)
+        
+        # Readers see either the old table or the new one, never a partial load
+        with engine.begin() as conn, conn.connection.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(table_name)))
+            cursor.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(
+                sql.Identifier(staging_table), sql.Identifier(table_name)))
+        
+        log_success(f"Table {table_name} replaced with {staging_table}")
+        return True
+        
+    except Exception as e:
+        handle_error(f"Error replacing table {table_name}: {e}")
+        return False
+
+def drop_table(table_name: str, db_url: str = DATABASE_URL) -> bool:
+    """
+    Drop a table if it exists.
+    
+    Parameters:
+    table_name (str): Name of the table
+    db_url (str): Database connection URL
+    
+    Returns:
+    bool: True if successful, False otherwise
+    """
+    try:
+        engine = _get_engine(db_url)
+        
+        with engine.begin() as conn, conn.connection.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(table_name)))
+        
+        log_message(f"Table {table_name} dropped")
+        return True
+        
+    except Exception as e:
+        handle_error(f"Error dropping table {table_name}: {e}")
+        return False
 
 def get_table_info(table_name: str = TABLE_NAME, db_url: str = DATABASE_URL) -> Optional[Dict[str, Any]]:
     """
@@ -171,7 +346,7 @@ def get_table_info(table_name: str = TABLE_NAME, db_url: str = DATABASE_URL) ->
     Dict: Table information or None if error
     """
     try:
-        engine = create_engine(db_url)
+        engine = _get_engine(db_url)
         inspector = inspect(engine)
         
         if not inspector.has_table(table_name):
@@ -201,11 +376,9 @@ def get_table_info(table_name: str = TABLE_NAME, db_url: str = DATABASE_URL) ->
     except Exception as e:
         handle_error(f"Error getting table info: {e}")
         return None
-    finally:
-        if 'engine' in locals():
-            engine.dispose()
 
-def generate_load_report(df: pd.DataFrame, table_name: str, loaded_rows: int) -> Dict[str, Any]:
+def generate_load_report(df: pd.DataFrame, table_name: str, loaded_rows: int,
+                         data_quality: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Generate a comprehensive load report.
     
@@ -213,11 +386,14 @@ def generate_load_report(df: pd.DataFrame, table_name: str, loaded_rows: int) ->
     df (pd.DataFrame): Source DataFrame
     table_name (str): Target table name
     loaded_rows (int): Number of rows loaded
+    data_quality (Dict, optional): Precomputed quality stats, e.g. from
+                                   prepare_data_for_db. Computed from df if omitted.
     
     Returns:
     Dict: Load report
     """
-    data_quality = get_data_quality_report(df)
+    if data_quality is None:
+        data_quality = get_data_quality_report(df)
     
     report = {
         'timestamp': pd.Timestamp.now().isoformat(),
@@ -227,7 +403,7 @@ def generate_load_report(df: pd.DataFrame, table_name: str, loaded_rows: int) ->
         'load_success_rate': (loaded_rows / len(df)) * 100 if len(df) > 0 else 0,
         'data_quality': data_quality,
         'columns_loaded': list(df.columns),
-        'data_types': df.dtypes.to_dict()
+        'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()}
     }
     
     return report
@@ -242,15 +418,99 @@ def save_load_report(report: Dict[str, Any]) -> None:
     try:
         report_file = OUTPUT_DIR / f"load_report_{report['table_name']}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        import json
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, default=str, option=options))
+        else:
+            import json
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, default=str)
         
         log_success(f"Load report saved: {report_file}")
         
     except Exception as e:
         handle_error(f"Error saving load report: {e}")
 
+def save_to_parquet(df: pd.DataFrame, table_name: str = TABLE_NAME) -> Optional[Path]:
+    """
+    Write the loaded data to OUTPUT_DIR as a zstd-compressed Parquet file.
+    
+    Parameters:
+    df (pd.DataFrame): Data prepared for the database
+    table_name (str): Table name, used as the file name
+    
+    Returns:
+    Path: Path of the Parquet file or None if it was not written
+    """
+    if not PARQUET_SINK or pq is None:
+        return None
+    
+    parquet_file = OUTPUT_DIR / f"{table_name}.parquet"
+    
+    try:
+        df.to_parquet(
+            parquet_file,
+            engine='pyarrow',
+            compression='zstd',
+            index=False,
+            use_dictionary=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE
+        )
+        log_success(f"Parquet copy saved: {parquet_file}")
+        return parquet_file
+        
+    except Exception as e:
+        # The Parquet copy is optional; the Postgres load already succeeded
+        handle_error(f"Error saving Parquet copy: {e}")
+        return None
+
+def remove_parquet_copy(table_name: str = TABLE_NAME) -> None:
+    """
+    Delete the Parquet copy of a table, for loads that don't rewrite it.
+    
+    Parameters:
+    table_name (str): Table name, used as the file name
+    """
+    parquet_file = OUTPUT_DIR / f"{table_name}.parquet"
+    
+    try:
+        if parquet_file.exists():
+            parquet_file.unlink()
+            log_message(f"Removed outdated Parquet copy: {parquet_file}")
+    except Exception as e:
+        handle_error(f"Error removing Parquet copy {parquet_file}: {e}")
+
+def query_data_parquet(filters: Optional[List[Tuple]] = None, columns: Optional[List[str]] = None,
+                       table_name: str = TABLE_NAME) -> Optional[pd.DataFrame]:
+    """
+    Read the Parquet copy of a table, pushing filters and projection down to PyArrow.
+    
+    Parameters:
+    filters (List[Tuple], optional): PyArrow filters, e.g. [('type', '==', 'Movie')]
+    columns (List[str], optional): Columns to read, all if omitted
+    table_name (str): Table name, used as the file name
+    
+    Returns:
+    pd.DataFrame: Matching rows or None if error
+    """
+    if pq is None:
+        handle_error("PyArrow is required to query Parquet data")
+        return None
+    
+    try:
+        parquet_file = OUTPUT_DIR / f"{table_name}.parquet"
+        
+        log_message(f"Reading Parquet data: {parquet_file} (filters: {filters})")
+        df = pq.read_table(parquet_file, columns=columns, filters=filters).to_pandas()
+        
+        log_success(f"Parquet query executed successfully: {len(df)} rows returned")
+        return df
+        
+    except Exception as e:
+        handle_error(f"Error querying Parquet data: {e}")
+        return None
+
 def query_data(query: str, db_url: str = DATABASE_URL) -> Optional[pd.DataFrame]:
     """
     Execute a SQL query and return results as DataFrame.
@@ -263,7 +523,7 @@ def query_data(query: str, db_url: str = DATABASE_URL) -> Optional[pd.DataFrame]
     pd.DataFrame: Query results or None if error
     """
     try:
-        engine = create_engine(db_url)
+        engine = _get_engine(db_url)
         
         log_message(f"Executing query: {query[:100]}...")
         df = pd.read_sql(query, engine)
@@ -274,9 +534,6 @@ def query_data(query: str, db_url: str = DATABASE_URL) -> Optional[pd.DataFrame]
     except Exception as e:
         handle_error(f"Error executing query: {e}")
         return None
-    finally:
-        if 'engine' in locals():
-            engine.dispose()
 
 def load_data(transformed_data: pd.DataFrame, 
               table_name: str = TABLE_NAME,
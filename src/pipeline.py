@@ -8,37 +8,53 @@ This module orchestrates the complete ETL pipeline:
 4. Generate reports and visualizations
 """
 
+import gc
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from config import NETFLIX_CSV_PATH, TABLE_NAME, OUTPUT_DIR
-from extract import extract_netflix_data
+from config import NETFLIX_CSV_PATH, TABLE_NAME, OUTPUT_DIR, FAST_IO
+from extract import extract_netflix_data, extract_netflix_arrow, iter_netflix_data
 from transform import transform_netflix_data
-from load import load_to_postgres, get_table_info
-from utils import log_message, handle_error, log_success, get_data_quality_report
+from load import load_to_postgres, get_table_info, replace_table, drop_table, remove_parquet_copy
+from utils import log_message, handle_error, log_success, get_data_quality_report, setup_logger
 from visualizations import create_netflix_dashboard, generate_analysis_report
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module for reports
+    orjson = None
+
 class NetflixETLPipeline:
     """
     Complete ETL Pipeline for Netflix data processing.
     """
     
-    def __init__(self, csv_path: Optional[Path] = None, table_name: str = TABLE_NAME):
+    def __init__(self, csv_path: Optional[Path] = None, table_name: str = TABLE_NAME,
+                 chunk_size: Optional[int] = None):
         """
         Initialize the ETL pipeline.
         
         Parameters:
         csv_path (Path, optional): Path to Netflix CSV file
         table_name (str): Target database table name
+        chunk_size (int, optional): Stream the CSV through transform and load
+                                    this many rows at a time instead of
+                                    holding the whole dataset in memory
         """
+        setup_logger()
+        
         self.csv_path = csv_path or NETFLIX_CSV_PATH
         self.table_name = table_name
         self.pipeline_start_time = None
         self.pipeline_end_time = None
         self.raw_data = None
+        self.raw_data_rows = 0
         self.transformed_data = None
+        self.chunk_size = chunk_size
+        self.chunk_summary = None
         self.pipeline_report = {}
     
     def run_full_pipeline(self) -> bool:
@@ -55,26 +71,30 @@ class NetflixETLPipeline:
         self.pipeline_start_time = datetime.now()
         
         try:
-            # Step 1: Extract
-            if not self._extract_data():
-                return False
-            
-            # Step 2: Transform
-            if not self._transform_data():
-                return False
-            
-            # Step 3: Load
-            if not self._load_data():
-                return False
+            if self.chunk_size:
+                # Steps 1-3 chunk by chunk; only summary stats are kept
+                if not self._process_in_chunks():
+                    return False
+            else:
+                # Step 1: Extract
+                if not self._extract_data():
+                    return False
+                
+                # Step 2: Transform
+                if not self._transform_data():
+                    return False
+                
+                # Step 3: Load
+                if not self._load_data():
+                    return False
+                
+                # Step 4: Generate reports and visualizations
+                if not self._generate_reports():
+                    return False
             
-            # Step 4: Generate reports and visualizations
-            if not self._generate_reports():
-                return False
-            
-            # Step 5: Create final pipeline report
+            # Step 5: Create final pipeline report (also records the end time)
             self._create_pipeline_report()
             
-            self.pipeline_end_time = datetime.now()
             duration = self.pipeline_end_time - self.pipeline_start_time
             
             log_success("=" * 80)
@@ -92,13 +112,20 @@ class NetflixETLPipeline:
         log_message("STEP 1: EXTRACTING DATA")
         log_message("-" * 40)
         
-        self.raw_data = extract_netflix_data(self.csv_path)
+        # With FAST_IO, text columns stay in Arrow buffers from the memory-mapped CSV
+        table = extract_netflix_arrow(self.csv_path) if FAST_IO else None
+        if table is not None:
+            self.raw_data = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+            del table
+        else:
+            self.raw_data = extract_netflix_data(self.csv_path)
         
         if self.raw_data is None:
             handle_error("Data extraction failed")
             return False
         
-        log_success(f"Extraction completed: {len(self.raw_data)} records extracted")
+        self.raw_data_rows = len(self.raw_data)
+        log_success(f"Extraction completed: {self.raw_data_rows} records extracted")
         return True
     
     def _transform_data(self) -> bool:
@@ -112,8 +139,12 @@ class NetflixETLPipeline:
             handle_error("Data transformation failed")
             return False
         
+        # The raw frame is no longer needed; release it before loading
+        self.raw_data = None
+        gc.collect()
+        
         # Log transformation summary
-        original_rows = len(self.raw_data)
+        original_rows = self.raw_data_rows
         final_rows = len(self.transformed_data)
         rows_removed = original_rows - final_rows
         
@@ -144,6 +175,110 @@ class NetflixETLPipeline:
         
         return True
     
+    def _process_in_chunks(self) -> bool:
+        """
+        Extract, transform and load the CSV one chunk at a time.
+        
+        Chunks are loaded into a staging table that replaces the target table
+        only after the last chunk, so a failed run leaves the old table intact.
+        The Parquet copy is not written chunk by chunk; once the table is
+        replaced, the previous run's copy is deleted so query_data_parquet
+        can't return rows that disagree with the database.
+        """
+        log_message(f"STEPS 1-3: STREAMING DATA IN CHUNKS OF {self.chunk_size} ROWS")
+        log_message("-" * 40)
+        
+        staging_table = f"{self.table_name}_staging"
+        
+        try:
+            loaded_rows = self._load_chunks(staging_table)
+        except Exception as e:
+            handle_error(f"Streaming failed after {self.raw_data_rows} rows: {e}")
+            loaded_rows = None
+        
+        if loaded_rows == 0:
+            handle_error("Data extraction failed" if self.raw_data_rows == 0
+                         else "No rows left to load after transformation")
+        
+        if not loaded_rows:
+            drop_table(staging_table)
+            return False
+        
+        if not replace_table(staging_table, self.table_name):
+            drop_table(staging_table)
+            return False
+        
+        remove_parquet_copy(self.table_name)
+        
+        table_info = get_table_info(self.table_name)
+        if table_info:
+            log_message(f"  - Rows in database: {table_info['row_count']}")
+        
+        log_success(f"Streaming completed: {self.raw_data_rows} rows read, {loaded_rows} rows loaded")
+        log_message("Dashboards and analysis report need the full dataset and are skipped in chunked mode")
+        return True
+    
+    def _load_chunks(self, staging_table: str) -> Optional[int]:
+        """
+        Stream the CSV into staging_table and collect the chunk summary.
+        
+        final_cleanup sorts each chunk on its own, so rows are ordered
+        within a chunk rather than globally and the table's row order differs
+        from the in-memory pipeline.
+        
+        Parameters:
+        staging_table (str): Table the chunks are loaded into
+        
+        Returns:
+        int: Number of rows loaded, or None if a chunk failed
+        """
+        seen_hashes = np.empty(0, dtype=np.uint64)
+        missing_values: Dict[str, int] = {}
+        loaded_rows = 0
+        
+        for chunk_number, chunk in enumerate(iter_netflix_data(self.csv_path, self.chunk_size), 1):
+            self.raw_data_rows += len(chunk)
+            source_columns = list(chunk.columns)
+            
+            transformed = transform_netflix_data(chunk)
+            del chunk
+            if transformed is None:
+                handle_error(f"Data transformation failed on chunk {chunk_number}")
+                return None
+            
+            # Duplicates inside a chunk are already gone; drop rows seen in earlier chunks
+            hashes = _row_hashes(transformed, source_columns)
+            is_new = ~_sorted_contains(seen_hashes, hashes)
+            if not is_new.all():
+                log_message(f"Removed {int((~is_new).sum())} rows duplicated from earlier chunks")
+                transformed = transformed[is_new]
+            
+            # Only the chunk's hashes are sorted; merging them is a single linear pass
+            new_hashes = np.unique(hashes[is_new])
+            seen_hashes = np.insert(seen_hashes, np.searchsorted(seen_hashes, new_hashes), new_hashes)
+            
+            if transformed.empty:
+                continue
+            
+            # The first chunk creates the staging table, the rest are appended to it
+            if_exists = 'replace' if loaded_rows == 0 else 'append'
+            if not load_to_postgres(transformed, staging_table, if_exists=if_exists, write_outputs=False):
+                handle_error(f"Data loading failed on chunk {chunk_number}")
+                return None
+            
+            loaded_rows += len(transformed)
+            for col, count in transformed.isna().sum().items():
+                missing_values[col] = missing_values.get(col, 0) + int(count)
+            
+            log_success(f"Chunk {chunk_number} loaded: {loaded_rows} rows so far")
+        
+        self.chunk_summary = {
+            'total_linhas': loaded_rows,
+            'total_colunas': len(missing_values),
+            'valores_ausentes': missing_values
+        }
+        return loaded_rows
+    
     def _generate_reports(self) -> bool:
         """Generate visualizations and analysis reports."""
         log_message("STEP 4: GENERATING REPORTS AND VISUALIZATIONS")
@@ -151,12 +286,12 @@ class NetflixETLPipeline:
         
         try:
             # Create visualizations dashboard
-            dashboard_path = create_netflix_dashboard(self.transformed_data)
+            dashboard_path, analysis_stats = create_netflix_dashboard(self.transformed_data, return_stats=True)
             if dashboard_path:
                 log_success(f"Dashboard created: {dashboard_path}")
             
-            # Generate analysis report
-            report_path = generate_analysis_report(self.transformed_data)
+            # Generate analysis report, reusing the dashboard statistics when available
+            report_path = generate_analysis_report(self.transformed_data, stats=analysis_stats)
             if report_path:
                 log_success(f"Analysis report created: {report_path}")
             
@@ -166,8 +301,23 @@ class NetflixETLPipeline:
             handle_error(f"Error generating reports: {e}")
             return False
     
+    def _transformed_rows(self) -> int:
+        """Number of transformed rows, whole dataset or summed over chunks."""
+        if self.transformed_data is not None:
+            return len(self.transformed_data)
+        return self.chunk_summary['total_linhas'] if self.chunk_summary else 0
+    
+    def _data_quality(self) -> Dict[str, Any]:
+        """Data quality of the transformed data, or the chunk summary when streaming."""
+        if self.transformed_data is not None:
+            # The pipeline never modifies transformed_data, so transform's cached report is current
+            return get_data_quality_report(self.transformed_data, cache=True)
+        return self.chunk_summary or {}
+    
     def _create_pipeline_report(self) -> None:
         """Create comprehensive pipeline execution report."""
+        # Set here so the report never depends on the caller's step order
+        self.pipeline_end_time = datetime.now()
         duration = self.pipeline_end_time - self.pipeline_start_time
         
         self.pipeline_report = {
@@ -180,9 +330,9 @@ class NetflixETLPipeline:
             'data_summary': {
                 'source_file': str(self.csv_path),
                 'target_table': self.table_name,
-                'raw_data_rows': len(self.raw_data) if self.raw_data is not None else 0,
-                'transformed_data_rows': len(self.transformed_data) if self.transformed_data is not None else 0,
-                'data_quality': get_data_quality_report(self.transformed_data) if self.transformed_data is not None else {}
+                'raw_data_rows': self.raw_data_rows,
+                'transformed_data_rows': self._transformed_rows(),
+                'data_quality': self._data_quality()
             }
         }
         
@@ -190,26 +340,68 @@ class NetflixETLPipeline:
         report_file = OUTPUT_DIR / f"pipeline_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            import json
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(self.pipeline_report, f, indent=2, default=str)
+            if orjson is not None:
+                # default=str only remains for dtype objects in the quality report
+                options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                report_file.write_bytes(orjson.dumps(self.pipeline_report, default=str, option=options))
+            else:
+                import json
+                with open(report_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.pipeline_report, f, indent=2, default=str)
             
             log_success(f"Pipeline report saved: {report_file}")
             
         except Exception as e:
             handle_error(f"Error saving pipeline report: {e}")
 
-def run_netflix_pipeline(csv_path: Optional[Path] = None) -> bool:
+def _row_hashes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Hash rows over the given columns, independent of categorical encoding.
+    
+    Parameters:
+    df (pd.DataFrame): Transformed chunk
+    columns (List[str]): Columns that identify a row
+    
+    Returns:
+    np.ndarray: One uint64 hash per row
+    """
+    # A column can be categorical in one chunk and plain text in another
+    values = {
+        col: df[col].astype(df[col].cat.categories.dtype)
+        if isinstance(df[col].dtype, pd.CategoricalDtype) else df[col]
+        for col in columns
+    }
+    return pd.util.hash_pandas_object(pd.DataFrame(values), index=False).to_numpy()
+
+def _sorted_contains(sorted_values: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Membership test of values in a sorted array, without re-sorting it.
+    
+    Parameters:
+    sorted_values (np.ndarray): Sorted array to search
+    values (np.ndarray): Values to look up
+    
+    Returns:
+    np.ndarray: Boolean mask, True where the value is in sorted_values
+    """
+    if sorted_values.size == 0:
+        return np.zeros(len(values), dtype=bool)
+    
+    positions = np.searchsorted(sorted_values, values)
+    return sorted_values[np.minimum(positions, sorted_values.size - 1)] == values
+
+def run_netflix_pipeline(csv_path: Optional[Path] = None, chunk_size: Optional[int] = None) -> bool:
     """
     Convenience function to run the complete Netflix ETL pipeline.
     
     Parameters:
     csv_path (Path, optional): Path to Netflix CSV file
+    chunk_size (int, optional): Process the data in chunks of this many rows
     
     Returns:
     bool: True if pipeline completed successfully
     """
-    pipeline = NetflixETLPipeline(csv_path)
+    pipeline = NetflixETLPipeline(csv_path, chunk_size=chunk_size)
     return pipeline.run_full_pipeline()
 
 if __name__ == "__main__":
@@ -1,9 +1,190 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from utils import log_message, handle_error, log_success, get_data_quality_report
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    TEXT_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:  # PyArrow is optional; fall back to pandas' own string dtype
+    pa = pc = None
+    TEXT_DTYPE = pd.StringDtype('python')
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the numpy fallback is used without it
+    njit = None
+
+# Placeholder strings that stand for missing values in text columns
+NULL_STRINGS = ['nan', 'None', '<NA>']
+
+# Text columns cleaned by clean_text_columns
+TEXT_COLUMNS = ['title', 'director', 'cast', 'country', 'rating', 'listed_in', 'description']
+
+# Rating -> audience group, built once at import; unmapped ratings are 'Other'
+RATING_CATEGORY_MAP = pd.Series({
+    'G': 'Kids', 'TV-Y': 'Kids', 'TV-Y7': 'Kids', 'TV-Y7-FV': 'Kids',
+    'PG': 'Family', 'TV-G': 'Family', 'TV-PG': 'Family',
+    'PG-13': 'Teen', 'TV-14': 'Teen',
+    'R': 'Adult', 'TV-MA': 'Adult', 'NC-17': 'Adult'
+})
+RATING_CATEGORIES = sorted(set(RATING_CATEGORY_MAP) | {'Other'})
+
+# First item of a comma-separated list, without surrounding whitespace
+FIRST_ITEM_PATTERN = r'^\s*([^,]+?)\s*(?:,|$)'
+
+# Netflix dates look like "September 25, 2021"
+DATE_ADDED_FORMAT = '%B %d, %Y'
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _year_features_kernel(years, min_year, max_year, out_years, out_decades):
+        for i in prange(years.shape[0]):
+            year = years[i]
+            # NaN fails both comparisons and is carried through unchanged
+            if year < min_year or year > max_year:
+                year = np.nan
+            out_years[i] = year
+            out_decades[i] = np.floor(year / 10) * 10
+    
+    @njit(parallel=True, cache=True)
+    def _count_items_kernel(data, offsets, valid, out):
+        for i in prange(out.shape[0]):
+            if not valid[i]:
+                out[i] = 0
+                continue
+            count = 1
+            for j in range(offsets[i], offsets[i + 1]):
+                if data[j] == 44:  # ord(',')
+                    count += 1
+            out[i] = count
+
+def _count_items_buffers(values: "pa.Array") -> np.ndarray:
+    """
+    Count comma-separated items by scanning the raw Arrow string buffers.
+    
+    Parameters:
+    values (pa.Array): Arrow string array
+    
+    Returns:
+    np.ndarray: Item counts as int64, 0 for nulls
+    """
+    values = values.cast(pa.large_string())
+    out = np.zeros(len(values), dtype=np.int64)
+    _, offsets_buffer, data_buffer = values.buffers()
+    if data_buffer is None or len(values) == 0:
+        # Only empty strings or nulls: one item per non-null row
+        out[values.is_valid().to_numpy(zero_copy_only=False)] = 1
+        return out
+    
+    offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[values.offset:values.offset + len(values) + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8)
+    valid = values.is_valid().to_numpy(zero_copy_only=False)
+    _count_items_kernel(data, offsets, valid, out)
+    return out
+
+def _count_items(series: pd.Series) -> pd.Series:
+    """
+    Count comma-separated items per row, 0 for missing values.
+    
+    Parameters:
+    series (pd.Series): List-like text column, e.g. 'Drama, Comedy'
+    
+    Returns:
+    pd.Series: Item counts as int64
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Count once per category and gather; the extra last entry maps code -1 to 0
+        counts = _count_items(pd.Series(series.cat.categories)).to_numpy()
+        lookup = np.append(counts, 0)
+        return pd.Series(lookup[series.cat.codes.to_numpy()], index=series.index)
+    
+    if pc is not None:
+        values = pa.array(series, from_pandas=True)
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        if njit is not None:
+            return pd.Series(_count_items_buffers(values), index=series.index)
+        
+        counts = pc.add(pc.count_substring(values, ','), 1)
+        counts = pc.if_else(pc.is_null(values), 0, counts)
+        return pd.Series(pc.cast(counts, pa.int64()).to_numpy(zero_copy_only=False), index=series.index)
+    
+    counts = series.str.count(',') + 1
+    return counts.where(series.notna(), 0).astype(np.int64)
+
+def _text_stats(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    Character length and whitespace-separated word count of a text column.
+    
+    Parameters:
+    series (pd.Series): Text column, already stripped
+    
+    Returns:
+    Tuple[pd.Series, pd.Series]: Lengths and word counts as Int64, NA for missing
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Measure each category once and gather; code -1 becomes NA
+        lengths, words = _text_stats(pd.Series(series.cat.categories))
+        codes = series.cat.codes.to_numpy()
+        return (pd.Series(lengths.array.take(codes, allow_fill=True), index=series.index),
+                pd.Series(words.array.take(codes, allow_fill=True), index=series.index))
+    
+    if pc is not None:
+        values = pa.array(series, from_pandas=True)
+        def to_int64(result):
+            result = pc.cast(result, pa.int64()).to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+            return pd.Series(result.array, index=series.index)
+        
+        return (to_int64(pc.utf8_length(values)),
+                to_int64(pc.list_value_length(pc.utf8_split_whitespace(values))))
+    
+    return (series.str.len().astype('Int64'),
+            series.str.split().str.len().astype('Int64'))
+
+def _sort_key(series: pd.Series) -> np.ndarray:
+    """
+    Turn a column into int64 sort keys with missing values ordered last.
+    
+    Parameters:
+    series (pd.Series): Column to sort by
+    
+    Returns:
+    np.ndarray: Keys whose order matches the column's sort order
+    """
+    missing = series.isna().to_numpy()
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        keys = series.to_numpy().view('i8').copy()
+    else:
+        # Codes of sorted categories follow the values' order
+        keys = pd.Categorical(series).codes.astype(np.int64)
+    keys[missing] = np.iinfo(np.int64).max
+    return keys
+
+def _year_features(years: np.ndarray, min_year: int, max_year: int):
+    """
+    Blank out unrealistic years and compute decades in a single pass.
+    
+    Parameters:
+    years (np.ndarray): Release years as float64, NaN for missing
+    min_year (int): Earliest valid year
+    max_year (int): Latest valid year
+    
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: Cleaned years and their decades
+    """
+    if njit is not None:
+        out_years = np.empty_like(years)
+        out_decades = np.empty_like(years)
+        _year_features_kernel(years, min_year, max_year, out_years, out_decades)
+        return out_years, out_decades
+    
+    out_years = np.where((years < min_year) | (years > max_year), np.nan, years)
+    return out_years, np.floor_divide(out_years, 10) * 10
+
 def transform_netflix_data(df: pd.DataFrame) -> Optional[pd.DataFrame]:
     """
     Comprehensive transformation pipeline for Netflix data.
@@ -20,8 +201,9 @@ def transform_netflix_data(df: pd.DataFrame) -> Optional[pd.DataFrame]:
     
     log_message("Starting Netflix data transformation pipeline")
     
-    # Create a copy to avoid modifying original data
-    df_transformed = df.copy()
+    # No upfront copy: clean_basic_data returns a new frame before any column
+    # is modified, so the caller's data is never changed
+    df_transformed = df
     
     # Log initial data quality
     initial_report = get_data_quality_report(df_transformed)
@@ -30,6 +212,9 @@ def transform_netflix_data(df: pd.DataFrame) -> Optional[pd.DataFrame]:
     # Step 1: Basic cleaning
     df_transformed = clean_basic_data(df_transformed)
     
+    # Low-cardinality text is cleaned per category instead of per row
+    df_transformed = categorize_low_cardinality(df_transformed, TEXT_COLUMNS)
+    
     # Step 2: Handle date columns
     df_transformed = transform_dates(df_transformed)
     
@@ -43,10 +228,10 @@ def transform_netflix_data(df: pd.DataFrame) -> Optional[pd.DataFrame]:
     df_transformed = process_categorical_data(df_transformed)
     
     # Step 6: Final validation and cleanup
-    df_transformed = final_cleanup(df_transformed)
+    df_transformed = final_cleanup(df_transformed, source_columns=list(df.columns))
     
-    # Log final data quality
-    final_report = get_data_quality_report(df_transformed)
+    # Log final data quality; cached so the pipeline report can reuse it for this frame
+    final_report = get_data_quality_report(df_transformed, cache=True)
     log_success(f"Transformation complete: {final_report['total_linhas']} rows, {final_report['linhas_duplicadas']} duplicates")
     
     return df_transformed
@@ -57,26 +242,27 @@ def clean_basic_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     log_message("Performing basic data cleaning")
     
-    initial_rows = len(df)
-    
-    # Remove exact duplicates
-    df = df.drop_duplicates()
-    duplicates_removed = initial_rows - len(df)
-    if duplicates_removed > 0:
-        log_message(f"Removed {duplicates_removed} duplicate rows")
+    # Exact duplicates
+    duplicated = df.duplicated().to_numpy()
     
     # Handle missing values strategically
     # Don't drop all NaN rows as some columns naturally have missing values
     
-    # Remove rows where critical columns are missing
+    # Rows where critical columns are missing
     critical_columns = ['show_id', 'title', 'type']
-    before_critical = len(df)
-    df = df.dropna(subset=critical_columns)
-    critical_removed = before_critical - len(df)
+    complete = df[critical_columns].notna().to_numpy().all(axis=1)
+    
+    duplicates_removed = int(duplicated.sum())
+    if duplicates_removed > 0:
+        log_message(f"Removed {duplicates_removed} duplicate rows")
+    
+    critical_removed = int((~complete & ~duplicated).sum())
     if critical_removed > 0:
         log_message(f"Removed {critical_removed} rows with missing critical data")
     
-    return df
+    # Both filters applied with a single take, so the frame is copied only once
+    keep = ~duplicated & complete
+    return df.take(np.flatnonzero(keep))
 
 def transform_dates(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -86,61 +272,103 @@ def transform_dates(df: pd.DataFrame) -> pd.DataFrame:
     
     # Clean date_added column
     if 'date_added' in df.columns:
-        # Remove leading/trailing whitespace
-        df['date_added'] = df['date_added'].astype(str).str.strip()
-        
-        # Replace 'nan' strings with actual NaN
-        df['date_added'] = df['date_added'].replace(['nan', 'None', ''], np.nan)
-        
-        # Convert to datetime
-        df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
+        if not pd.api.types.is_datetime64_dtype(df['date_added']):
+            # Remove leading/trailing whitespace and treat placeholders as missing
+            dates = df['date_added'].astype(TEXT_DTYPE).str.strip()
+            dates = dates.mask(dates.isin(NULL_STRINGS + ['']))
+            
+            # Convert to datetime with the known format instead of guessing it
+            df['date_added'] = pd.to_datetime(dates, format=DATE_ADDED_FORMAT, errors='coerce')
         
         # Extract additional date features
         df['date_added_year'] = df['date_added'].dt.year
         df['date_added_month'] = df['date_added'].dt.month
-        df['date_added_day_of_week'] = df['date_added'].dt.day_name()
+        
+        # Day of week straight from the day count: 1970-01-01 was a Thursday
+        nanoseconds = df['date_added'].to_numpy().view('i8')
+        day_codes = (nanoseconds // 86_400_000_000_000 + 3) % 7
+        day_codes[df['date_added'].isna().to_numpy()] = -1
+        df['date_added_day_of_week'] = pd.Categorical.from_codes(day_codes, categories=DAY_NAMES)
         
         log_message(f"Processed date_added column: {df['date_added'].notna().sum()} valid dates")
     
     # Clean release_year column
     if 'release_year' in df.columns:
-        df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
+        release_year = pd.to_numeric(df['release_year'], errors='coerce')
         
-        # Filter out unrealistic years
+        # Filter out unrealistic years and create decade feature in one pass
         current_year = datetime.now().year
-        df.loc[(df['release_year'] < 1900) | (df['release_year'] > current_year + 2), 'release_year'] = np.nan
-        
-        # Create decade feature
-        df['decade'] = (df['release_year'] // 10) * 10
+        years, decades = _year_features(
+            release_year.to_numpy(dtype=np.float64, na_value=np.nan), 1900, current_year + 2
+        )
+        df['release_year'] = pd.Series(years, index=df.index)
+        df['decade'] = pd.Series(decades, index=df.index)
         
         log_message(f"Processed release_year column: {df['release_year'].notna().sum()} valid years")
     
     return df
 
+def categorize_low_cardinality(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Convert text columns with few distinct values to category dtype.
+    
+    A column qualifies when it has fewer unique values than a quarter of
+    its rows, so later string operations only touch the categories.
+    """
+    for col in columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            if df[col].nunique() < len(df) // 4:
+                df[col] = df[col].astype('category')
+    return df
+
+def _clean_categories(series: pd.Series) -> pd.Series:
+    """
+    Clean a categorical text column by cleaning its categories once.
+    
+    Categories that become equal after stripping are merged and the ones
+    that become empty or placeholders turn into missing values.
+    """
+    categories = pd.Series(series.cat.categories).astype(TEXT_DTYPE)
+    categories = categories.mask(categories.isin(NULL_STRINGS)).str.strip()
+    categories = categories.mask(categories == '')
+    
+    # Re-code rows through the merged categories; code -1 stays missing
+    category_codes, merged = pd.factorize(categories, sort=True)
+    lookup = np.append(category_codes, -1)
+    codes = lookup[series.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=merged), index=series.index)
+
 def clean_text_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and standardize text columns.
     """
     log_message("Cleaning text columns")
     
-    text_columns = ['title', 'director', 'cast', 'country', 'rating', 'listed_in', 'description']
-    
-    for col in text_columns:
-        if col in df.columns:
-            # Convert to string and handle NaN
-            df[col] = df[col].astype(str)
-            df[col] = df[col].replace(['nan', 'None'], np.nan)
-            
-            # Clean whitespace
-            df[col] = df[col].str.strip()
-            
-            # Replace empty strings with NaN
-            df[col] = df[col].replace('', np.nan)
+    present_columns = []
+    for col in TEXT_COLUMNS:
+        if col not in df.columns:
+            continue
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = _clean_categories(df[col])
+        else:
+            present_columns.append(col)
+    
+    if present_columns:
+        # Arrow-backed strings keep missing values as NA and run str ops natively
+        text = df[present_columns].astype(TEXT_DTYPE)
+        text = text.mask(text.isin(NULL_STRINGS))
+        
+        # Clean whitespace and replace empty strings with NA
+        text = text.apply(lambda col: col.str.strip())
+        text = text.mask(text == '')
+        
+        for col in present_columns:
+            df[col] = text[col]
     
     # Special handling for specific columns
     if 'duration' in df.columns:
-        df['duration'] = df['duration'].astype(str).str.strip()
-        df['duration'] = df['duration'].replace(['nan', 'None', ''], np.nan)
+        duration = df['duration'].astype(TEXT_DTYPE).str.strip()
+        df['duration'] = duration.mask(duration.isin(NULL_STRINGS + ['']))
     
     log_message("Text columns cleaned")
     return df
@@ -153,13 +381,14 @@ def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     
     # Extract duration information
     if 'duration' in df.columns:
-        # Extract numeric duration and unit
-        df['duration_value'] = df['duration'].str.extract(r'(\d+)').astype(float)
-        df['duration_unit'] = df['duration'].str.extract(r'(min|Season|Seasons)$')
+        # Extract numeric duration and unit with a single regex pass
+        parts = df['duration'].str.extract(r'(?P<value>\d+)\s*(?P<unit>min|Seasons?)$')
+        df['duration_value'] = parts['value'].astype(float)
+        df['duration_unit'] = parts['unit']
         
-        # Standardize duration units
-        df['is_movie'] = df['duration_unit'] == 'min'
-        df['is_tv_show'] = df['duration_unit'].isin(['Season', 'Seasons'])
+        # Standardize duration units: anything with a unit other than minutes is seasons
+        df['is_movie'] = df['duration_unit'].isin(['min'])
+        df['is_tv_show'] = df['duration_unit'].notna() & ~df['is_movie']
         
         log_message(f"Duration features: {df['is_movie'].sum()} movies, {df['is_tv_show'].sum()} TV shows")
     
@@ -168,8 +397,7 @@ def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     for col in list_columns:
         if col in df.columns:
             # Count number of items (split by comma)
-            df[f'{col}_count'] = df[col].str.count(',') + 1
-            df.loc[df[col].isna(), f'{col}_count'] = 0
+            df[f'{col}_count'] = _count_items(df[col])
     
     # Content age analysis
     if 'release_year' in df.columns and 'date_added' in df.columns:
@@ -178,18 +406,30 @@ def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     
     # Text length features
     if 'description' in df.columns:
-        df['description_length'] = df['description'].str.len()
-        df['description_word_count'] = df['description'].str.split().str.len()
+        df['description_length'], df['description_word_count'] = _text_stats(df['description'])
     
     # Rating categories
     if 'rating' in df.columns:
-        df['rating_category'] = df['rating'].map({
-            'G': 'Kids', 'TV-Y': 'Kids', 'TV-Y7': 'Kids', 'TV-Y7-FV': 'Kids',
-            'PG': 'Family', 'TV-G': 'Family', 'TV-PG': 'Family',
-            'PG-13': 'Teen', 'TV-14': 'Teen',
-            'R': 'Adult', 'TV-MA': 'Adult', 'NC-17': 'Adult'
-        })
-        df['rating_category'] = df['rating_category'].fillna('Other')
+        # Map each distinct rating once with the prebuilt table, then gather per
+        # row through the codes; the extra last entry catches missing ratings (code -1)
+        df['rating'] = df['rating'].astype('category')
+        groups = RATING_CATEGORY_MAP.reindex(df['rating'].cat.categories.astype(object)).fillna('Other')
+        lookup = np.append(
+            pd.Categorical(groups, categories=RATING_CATEGORIES).codes,
+            RATING_CATEGORIES.index('Other')
+        )
+        codes = lookup[df['rating'].cat.codes.to_numpy()]
+        df['rating_category'] = pd.Categorical.from_codes(
+            codes, categories=RATING_CATEGORIES
+        ).remove_unused_categories()
+    
+    # Downcast numeric features: years and ages fit float32, counts and lengths small ints
+    for col in ('release_year', 'decade', 'content_age_when_added'):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in ('description_length', 'description_word_count') + tuple(f'{col}_count' for col in list_columns):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
     
     log_message("Feature engineering completed")
     return df
@@ -209,27 +449,34 @@ def process_categorical_data(df: pd.DataFrame) -> pd.DataFrame:
     
     # Handle country data - extract primary country
     if 'country' in df.columns:
-        df['primary_country'] = df['country'].str.split(',').str[0].str.strip()
+        df['primary_country'] = df['country'].str.extract(FIRST_ITEM_PATTERN, expand=False)
         df['is_international'] = df['country'].str.contains(',', na=False)
     
     # Handle genres - extract primary genre
     if 'listed_in' in df.columns:
-        df['primary_genre'] = df['listed_in'].str.split(',').str[0].str.strip()
-        df['genre_diversity'] = df['listed_in'].str.count(',') + 1
-        df.loc[df['listed_in'].isna(), 'genre_diversity'] = 0
+        df['primary_genre'] = df['listed_in'].str.extract(FIRST_ITEM_PATTERN, expand=False)
+        df['genre_diversity'] = _count_items(df['listed_in'])
     
     log_message("Categorical data processing completed")
     return df
 
-def final_cleanup(df: pd.DataFrame) -> pd.DataFrame:
+def final_cleanup(df: pd.DataFrame, source_columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Final cleanup and validation.
+    
+    Parameters:
+    df (pd.DataFrame): Transformed data
+    source_columns (List[str], optional): Original columns; the engineered
+                                          columns derive from them, so only
+                                          these need to be checked for duplicates
     """
     log_message("Performing final cleanup")
     
-    # Remove any remaining exact duplicates that might have been created
+    # Text cleaning can make rows that differed only in whitespace identical;
+    # engineered features can't add new duplicates, so only hash source columns
     initial_rows = len(df)
-    df = df.drop_duplicates()
+    subset = [col for col in source_columns if col in df.columns] if source_columns else None
+    df = df[~df.duplicated(subset=subset).to_numpy()]
     if len(df) < initial_rows:
         log_message(f"Removed {initial_rows - len(df)} duplicate rows in final cleanup")
     
@@ -241,10 +488,12 @@ def final_cleanup(df: pd.DataFrame) -> pd.DataFrame:
         sort_columns.append('show_id')
     
     if sort_columns:
-        df = df.sort_values(sort_columns, na_position='last')
+        # Stable lexsort on the key arrays only, then a single take of the frame
+        keys = [_sort_key(df[col]) for col in sort_columns]
+        df = df.take(np.lexsort(keys[::-1]))
     
-    # Reset index
-    df = df.reset_index(drop=True)
+    # Reset index without copying the data again
+    df.index = pd.RangeIndex(len(df))
     
     log_message("Final cleanup completed")
     return df
@@ -9,6 +9,8 @@ Este módulo fornece utilitários comuns incluindo:
 - Relatórios de qualidade de dados
 """
 
+import sys
+import weakref
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -16,31 +18,42 @@ from typing import Optional, Dict, Any
 from loguru import logger
 from config import LOGS_DIR, LOG_LEVEL, LOG_FORMAT
 
-# Configura o logger
-logger.remove()  # Remove handler padrão
-logger.add(
-    LOGS_DIR / "pipeline.log",
-    format=LOG_FORMAT,
-    level=LOG_LEVEL,
-    rotation="10 MB",
-    retention="30 days"
-)
-logger.add(
-    lambda msg: print(msg, end=""),
-    format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}",
-    level=LOG_LEVEL
-)
+_logger_configurado = False
+
+def configurar_logger() -> None:
+    """Configura o logger uma única vez (arquivo com rotação e console)."""
+    global _logger_configurado
+    if _logger_configurado:
+        return
+    
+    logger.remove()  # Remove handler padrão
+    logger.add(
+        LOGS_DIR / "pipeline.log",
+        format=LOG_FORMAT,
+        level=LOG_LEVEL,
+        rotation="10 MB",
+        retention="30 days"
+    )
+    logger.add(
+        sys.stdout,
+        format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}",
+        level=LOG_LEVEL
+    )
+    _logger_configurado = True
 
 def registrar_mensagem(message: str) -> None:
     """Registra uma mensagem de informação."""
+    configurar_logger()
     logger.info(message)
 
 def tratar_erro(error: str) -> None:
     """Trata erros registrando-os."""
+    configurar_logger()
     logger.error(error)
 
 def registrar_sucesso(message: str) -> None:
     """Registra uma mensagem de sucesso."""
+    configurar_logger()
     logger.success(message)
 
 def validar_dados(data: pd.DataFrame) -> bool:
@@ -71,21 +84,56 @@ def validar_dados_netflix(df: pd.DataFrame) -> bool:
     registrar_sucesso("Validação da estrutura dos dados do Netflix passou")
     return True
 
-def get_relatorio_qualidade_dados(df: pd.DataFrame) -> Dict[str, Any]:
-    """Gera um relatório abrangente de qualidade de dados."""
+def estimar_uso_de_memoria(df: pd.DataFrame, tamanho_amostra: int = 1000) -> int:
+    """Estima o uso de memória sem percorrer todas as strings (amostra das colunas object)."""
+    uso = int(df.memory_usage(deep=False).sum())
+    if df.empty:
+        return uso
+    
+    # Colunas object: tamanho médio dos objetos de uma amostra vezes o número de linhas
+    n_amostra = min(len(df), tamanho_amostra)
+    for coluna in df.select_dtypes(include=['object']).columns:
+        amostra = df[coluna].sample(n_amostra, random_state=0)
+        uso += int(amostra.map(sys.getsizeof).mean() * len(df))
+    return uso
+
+# Relatórios guardados com cache=True, por id do DataFrame (removidos quando o DataFrame é coletado)
+_cache_relatorios: Dict[int, tuple] = {}
+
+def get_relatorio_qualidade_dados(df: pd.DataFrame, deep: bool = False, cache: bool = False) -> Dict[str, Any]:
+    """
+    Gera um relatório abrangente de qualidade de dados.
+    
+    Com cache=True o relatório é guardado e reaproveitado para o mesmo DataFrame.
+    A validação só compara forma, colunas e tipos: alterações in-place que os
+    mantêm (fillna(inplace=True), df.loc[...] = ...) não são detectadas, então
+    só use cache=True com DataFrames que não serão mais modificados.
+    """
+    tipos = df.dtypes
+    assinatura = (df.shape, tuple(df.columns), tuple(tipos), deep)
+    
+    em_cache = _cache_relatorios.get(id(df)) if cache else None
+    if em_cache is not None and em_cache[0]() is df and em_cache[1] == assinatura:
+        return dict(em_cache[2])
+    
     relatorio = {
         'total_linhas': len(df),
         'total_colunas': len(df.columns),
-        'valores_ausentes': df.isnull().sum().to_dict(),
-        'linhas_duplicadas': df.duplicated().sum(),
-        'tipos_de_dados': df.dtypes.to_dict(),
-        'uso_de_memoria': df.memory_usage(deep=True).sum(),
-        'colunas_numericas': df.select_dtypes(include=[np.number]).columns.tolist(),
-        'colunas_categoricas': df.select_dtypes(include=['object']).columns.tolist()
+        'valores_ausentes': df.isna().sum().to_dict(),
+        'linhas_duplicadas': int(df.duplicated().sum()),
+        'tipos_de_dados': tipos.to_dict(),
+        'uso_de_memoria': int(df.memory_usage(deep=True).sum()) if deep else estimar_uso_de_memoria(df),
+        'colunas_numericas': [col for col, tipo in tipos.items() if pd.api.types.is_numeric_dtype(tipo) and not pd.api.types.is_bool_dtype(tipo)],
+        'colunas_categoricas': [col for col, tipo in tipos.items() if tipo == object]
     }
     
+    if cache:
+        chave = id(df)
+        referencia = weakref.ref(df, lambda _, chave=chave: _cache_relatorios.pop(chave, None))
+        _cache_relatorios[chave] = (referencia, assinatura, relatorio)
+    
     registrar_mensagem(f"Relatório de qualidade de dados gerado para {relatorio['total_linhas']} linhas")
-    return relatorio
+    return dict(relatorio)
 
 def salvar_arquivo(data: str, filename: Path) -> None:
     """Salva dados em um arquivo especificado."""
@@ -106,6 +154,7 @@ def criar_diretorio(path: Path) -> None:
         tratar_erro(f"Erro ao criar diretório {path}", e)
 
 # Aliases para compatibilidade com código existente
+setup_logger = configurar_logger
 log_message = registrar_mensagem
 handle_error = tratar_erro
 log_success = registrar_sucesso
@@ -113,5 +162,6 @@ validate_data = validar_dados
 validate_dataframe = validar_dados
 validate_netflix_data = validar_dados_netflix
 get_data_quality_report = get_relatorio_qualidade_dados
+estimate_memory_usage = estimar_uso_de_memoria
 save_to_file = salvar_arquivo
 create_directory = criar_diretorio
\ No newline at end of file
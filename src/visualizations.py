@@ -5,53 +5,372 @@ This module creates comprehensive visualizations and analysis reports
 for the Netflix dataset after ETL processing.
 """
 
+import functools
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Union
 
-from config import OUTPUT_DIR, FIGURE_SIZE, DPI, COLOR_PALETTE
+from config import OUTPUT_DIR, FIGURE_SIZE, DPI, COLOR_PALETTE, FAST_DASHBOARD, PNG_COMPRESS_LEVEL
 from utils import log_message, handle_error, log_success
 
+try:
+    from fast_histogram import histogram1d
+except ImportError:  # fast-histogram is optional; the numpy fallback is used without it
+    histogram1d = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the numpy fallback is used without it
+    njit = None
+
+# Label columns hashed repeatedly by the analyses; stored as categoricals
+CATEGORY_COLUMNS = ['type', 'primary_country', 'primary_genre', 'rating_category', 'decade']
+
+# Figure title of each analysis, keyed like the dashboard statistics
+ANALYSIS_TITLES = {
+    'content': 'Netflix Content Type Analysis',
+    'temporal': 'Netflix Temporal Analysis',
+    'geographic': 'Netflix Geographic Analysis',
+    'genre': 'Netflix Genre Analysis'
+}
+
+# PNGs are encoded through Pillow with a fast zlib level instead of the default 6
+PNG_PIL_KWARGS = {'compress_level': PNG_COMPRESS_LEVEL, 'optimize': False}
+
+# Path simplification used when saving dashboards in fast mode
+FAST_MODE_RC = {'path.simplify': True, 'path.simplify_threshold': 1.0}
+
 # Set style for matplotlib
 plt.style.use('seaborn-v0_8')
 sns.set_palette(COLOR_PALETTE)
 
+if njit is not None:
+    # Serial: the plotted arrays are small, and a parallel kernel is not safe to launch
+    # from caller threads with Numba's default workqueue layer
+    @njit(nogil=True, cache=True)
+    def _uniform_histogram_kernel(values, bins, lo, hi):
+        counts = np.zeros(bins, dtype=np.int64)
+        scale = bins / (hi - lo)
+        for i in range(values.shape[0]):
+            index = int((values[i] - lo) * scale)
+            # The upper edge belongs to the last bin, as in np.histogram
+            if index == bins:
+                index = bins - 1
+            counts[index] += 1
+        return counts
+
+def _uniform_histogram(values: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count values into uniform bins spanning their range, matching np.histogram.
+    
+    Parameters:
+    values (np.ndarray): Non-empty array without NaN values
+    bins (int): Number of bins
+    
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: Bin counts and the bins + 1 edges
+    """
+    values = np.asarray(values, dtype=np.float64)
+    lo, hi = values.min(), values.max()
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, bins + 1)
+    
+    if histogram1d is not None:
+        counts = histogram1d(values, bins=bins, range=(lo, hi))
+        # fast-histogram leaves out the upper edge; np.histogram puts it in the last bin
+        counts[-1] += np.count_nonzero(values == hi)
+        return counts, edges
+    
+    if njit is not None:
+        return _uniform_histogram_kernel(values, bins, lo, hi), edges
+    
+    # Scale to a bin index and count with bincount instead of searchsorted
+    indices = ((values - lo) * (bins / (hi - lo))).astype(np.intp)
+    np.minimum(indices, bins - 1, out=indices)
+    return np.bincount(indices, minlength=bins), edges
+
+def _integer_counts(values: np.ndarray, step: int = 1) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Count values that are whole multiples of step apart with np.bincount.
+    
+    Parameters:
+    values (np.ndarray): Float array without NaN values
+    step (int): Spacing between distinct values (10 for decades)
+    
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: Distinct values in ascending order and their counts,
+    or None if the values are not on the step grid
+    """
+    if not values.size:
+        return None
+    base = values.min()
+    offsets = (values - base) / step
+    indices = offsets.astype(np.int64)
+    if not np.array_equal(indices, offsets):
+        return None
+    counts = np.bincount(indices)
+    present = np.flatnonzero(counts)
+    return base + present * step, counts[present]
+
+def _plot_histogram(ax: plt.Axes, values: np.ndarray, bins: int) -> None:
+    """Draw a histogram of values on ax from precomputed uniform bin counts."""
+    counts, edges = _uniform_histogram(values, bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, edgecolor='black')
+
 class NetflixAnalyzer:
     """
     Comprehensive analyzer for Netflix data with visualization capabilities.
     """
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, fast_mode: bool = False):
         """
         Initialize the analyzer with Netflix data.
         
         Parameters:
         df (pd.DataFrame): Cleaned Netflix data
+        fast_mode (bool): Use the constrained layout engine instead of tight_layout
         """
-        self.df = df.copy()
+        # Columns are shared with df, only the ones cast to category are new
+        self.df = pd.DataFrame({
+            column: series.astype('category')
+            if column in CATEGORY_COLUMNS and not isinstance(series.dtype, pd.CategoricalDtype) else series
+            for column, series in df.items()
+        }, copy=False)
+        self._input_df = df
+        self.fast_mode = fast_mode
+        self._overview: Optional[Dict] = None
         self.output_dir = OUTPUT_DIR
         self.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-    def create_content_type_analysis(self) -> Tuple[plt.Figure, Dict]:
-        """Create analysis of content types (Movies vs TV Shows)."""
-        fig, axes = plt.subplots(2, 2, figsize=FIGURE_SIZE)
-        fig.suptitle('Netflix Content Type Analysis', fontsize=16, fontweight='bold')
+        # Per-column value_counts cache and type masks computed once
+        self._vc: Dict[str, pd.Series] = {}
+        self._arrays: Dict[str, np.ndarray] = {}
+        if 'type' in self.df.columns:
+            self._is_movie = (self.df['type'] == 'Movie').to_numpy(dtype=bool, na_value=False)
+            self._is_tv = (self.df['type'] == 'TV Show').to_numpy(dtype=bool, na_value=False)
+        else:
+            self._is_movie = np.zeros(len(self.df), dtype=bool)
+            self._is_tv = np.zeros(len(self.df), dtype=bool)
+    
+    @functools.cached_property
+    def memory_mb(self) -> float:
+        """Deep memory usage of the input frame in MB, measured on first use."""
+        return self._input_df.memory_usage(deep=True).sum() / 1024**2
+    
+    def _value_counts(self, column: str) -> pd.Series:
+        """
+        Return the (memoized) non-zero value counts of a column.
+        
+        Parameters:
+        column (str): Column name
+        
+        Returns:
+        pd.Series: Value counts sorted by frequency
+        """
+        if column not in self._vc:
+            counts = self.df[column].value_counts()
+            # Unused categories show up with a zero count
+            self._vc[column] = counts[counts > 0]
+        return self._vc[column]
+    
+    def _float_values(self, column: str) -> np.ndarray:
+        """
+        Return a numeric column as a (memoized) float64 array with NaN for missing values.
+        
+        Parameters:
+        column (str): Numeric column name
+        
+        Returns:
+        np.ndarray: Float array aligned with the rows of the frame
+        """
+        if column not in self._arrays:
+            self._arrays[column] = self.df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._arrays[column]
+    
+    def _masked_values(self, column: str, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Return the non-missing values of a numeric column, optionally for the rows in mask.
+        
+        Parameters:
+        column (str): Numeric column name
+        mask (np.ndarray): Optional boolean row mask
         
+        Returns:
+        np.ndarray: Float array without NaN values
+        """
+        values = self._float_values(column)
+        keep = ~np.isnan(values)
+        if mask is not None:
+            keep &= mask
+        return values[keep]
+    
+    def _new_figure(self, title: str) -> Tuple[Figure, np.ndarray]:
+        """
+        Create a 2x2 analysis figure outside the pyplot state machine.
+        
+        Parameters:
+        title (str): Figure title
+        
+        Returns:
+        Tuple[Figure, np.ndarray]: Figure and its 2x2 array of axes
+        """
+        # The constrained engine lays the figure out during the draw it already does,
+        # instead of the extra tight_layout pass
+        fig = Figure(figsize=FIGURE_SIZE, layout='constrained' if self.fast_mode else None)
+        # Attach an Agg canvas directly; the figure is never registered with pyplot
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(2, 2)
+        fig.suptitle(title, fontsize=16, fontweight='bold')
+        return fig, axes
+    
+    def _finish_figure(self, fig: Figure) -> Figure:
+        """Apply tight_layout to a finished figure unless fast mode handles the layout."""
+        if not self.fast_mode:
+            fig.tight_layout()
+        return fig
+    
+    def _analyses(self) -> Dict[str, Tuple]:
+        """Map each analysis name to its (stats computation, panel drawing) methods."""
+        return {
+            'content': (self._compute_content_type_stats, self._draw_content_type),
+            'temporal': (self._compute_temporal_stats, self._draw_temporal),
+            'geographic': (self._compute_geographic_stats, self._draw_geographic),
+            'genre': (self._compute_genre_stats, self._draw_genre)
+        }
+    
+    def _plot(self, name: str, stats: Dict) -> Figure:
+        """Render one analysis as its own 2x2 figure."""
+        fig, axes = self._new_figure(ANALYSIS_TITLES[name])
+        self._analyses()[name][1](axes, stats)
+        return self._finish_figure(fig)
+    
+    def _plot_all(self, stats: Dict) -> Figure:
+        """
+        Render every analysis as one quadrant of a single 4x4 grid figure.
+        
+        Parameters:
+        stats (Dict): Statistics of each analysis, keyed like ANALYSIS_TITLES
+        
+        Returns:
+        Figure: Combined dashboard figure
+        """
+        # One figure means one renderer, font setup and bounding box pass for all 16 panels;
+        # subfigures need the constrained layout engine
+        fig = Figure(figsize=(FIGURE_SIZE[0] * 2, FIGURE_SIZE[1] * 2), layout='constrained')
+        FigureCanvasAgg(fig)
+        fig.suptitle('Netflix Analysis Dashboard', fontsize=20, fontweight='bold')
+        for subfig, (name, (_, draw)) in zip(fig.subfigures(2, 2).flat, self._analyses().items()):
+            subfig.suptitle(ANALYSIS_TITLES[name], fontsize=16, fontweight='bold')
+            draw(subfig.subplots(2, 2), stats[name])
+        return fig
+    
+    def _sorted_counts(self, column: str, step: int = 1, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Count the values of a column in ascending value order.
+        
+        Parameters:
+        column (str): Column name
+        step (int): Spacing of integer-valued data, used for the np.bincount fast path
+        mask (np.ndarray): Optional boolean row mask
+        
+        Returns:
+        Tuple[np.ndarray, np.ndarray]: Distinct values and their counts
+        """
+        dtype = self.df[column].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            # Small-range integer data: one bincount pass, already sorted by value
+            result = _integer_counts(self._masked_values(column, mask), step)
+            if result is not None:
+                return result
+        
+        counts = self._value_counts(column) if mask is None else self.df.loc[mask, column].value_counts()
+        counts = counts[counts > 0].sort_index()
+        return counts.index.to_numpy(), counts.to_numpy()
+    
+    def _count_by_type(self, column: str, values: Optional[pd.Index] = None) -> pd.DataFrame:
+        """
+        Count titles per value of a column and content type.
+        
+        Parameters:
+        column (str): Column used as the table rows
+        values (pd.Index): Optional subset of column values to keep
+        
+        Returns:
+        pd.DataFrame: Counts with one row per column value and one column per type
+        """
+        # Only the two key columns are filtered, not the whole frame
+        frame = self.df[[column, 'type']]
+        if values is not None:
+            frame = frame[frame[column].isin(values)]
+        return frame.groupby([column, 'type'], observed=True).size().unstack(fill_value=0)
+    
+    def _unique_per_year(self, column: str) -> pd.Series:
+        """
+        Count the distinct values of a categorical column per year added.
+        
+        Parameters:
+        column (str): Categorical column name
+        
+        Returns:
+        pd.Series: Number of distinct non-missing values, indexed by date_added_year
+        """
+        years = self._float_values('date_added_year')
+        codes = self.df[column].cat.codes.to_numpy()
+        has_year = ~np.isnan(years)
+        year_values, year_index = np.unique(years[has_year], return_inverse=True)
+        
+        # Mark each (year, category) pair seen; missing values (code -1) land in the extra last column
+        n_categories = len(self.df[column].cat.categories)
+        seen = np.zeros((len(year_values), n_categories + 1), dtype=bool)
+        seen[year_index, codes[has_year]] = True
+        return pd.Series(seen[:, :n_categories].sum(axis=1), index=pd.Index(year_values, name='date_added_year'))
+    
+    def _compute_overview_stats(self) -> Dict:
+        """Compute (once) the dataset-level statistics of the report header and quality section."""
+        if self._overview is None:
+            missing = self.df.isna().sum()
+            self._overview = {
+                'total_content': len(self.df),
+                'missing_values': missing,
+                'total_missing': int(missing.sum()),
+                'memory_mb': self.memory_mb
+            }
+        return self._overview
+    
+    def _compute_content_type_stats(self) -> Dict:
+        """Compute content type statistics (Movies vs TV Shows)."""
+        movies = int(self._is_movie.sum())
+        return {
+            'total_content': len(self.df),
+            'movies': movies,
+            'tv_shows': int(self._is_tv.sum()),
+            'movie_percentage': (movies / len(self.df)) * 100,
+            'avg_movie_duration': self._masked_values('duration_value', self._is_movie).mean() if 'duration_value' in self.df.columns else None
+        }
+    
+    def _draw_content_type(self, axes: np.ndarray, stats: Dict) -> None:
+        """Draw the content type analysis panels on a 2x2 array of axes."""
         # Content type distribution
-        type_counts = self.df['type'].value_counts()
+        type_counts = self._value_counts('type')
         axes[0, 0].pie(type_counts.values, labels=type_counts.index, autopct='%1.1f%%', startangle=90)
         axes[0, 0].set_title('Content Type Distribution')
         
         # Content type by year added
         if 'date_added_year' in self.df.columns:
-            yearly_content = self.df.groupby(['date_added_year', 'type']).size().unstack(fill_value=0)
+            yearly_content = self._count_by_type('date_added_year')
             yearly_content.plot(kind='bar', ax=axes[0, 1], stacked=True)
             axes[0, 1].set_title('Content Added by Year and Type')
             axes[0, 1].set_xlabel('Year Added')
@@ -61,47 +380,45 @@ class NetflixAnalyzer:
         
         # Duration analysis for movies
         if 'duration_value' in self.df.columns:
-            movies = self.df[self.df['type'] == 'Movie']['duration_value'].dropna()
-            if not movies.empty:
-                axes[1, 0].hist(movies, bins=30, alpha=0.7, edgecolor='black')
+            movies = self._masked_values('duration_value', self._is_movie)
+            if movies.size:
+                _plot_histogram(axes[1, 0], movies, bins=30)
                 axes[1, 0].set_title('Movie Duration Distribution')
                 axes[1, 0].set_xlabel('Duration (minutes)')
                 axes[1, 0].set_ylabel('Frequency')
-                axes[1, 0].axvline(movies.mean(), color='red', linestyle='--', 
-                                 label=f'Mean: {movies.mean():.1f} min')
+                axes[1, 0].axvline(stats['avg_movie_duration'], color='red', linestyle='--', 
+                                 label=f"Mean: {stats['avg_movie_duration']:.1f} min")
                 axes[1, 0].legend()
         
         # TV Show seasons analysis
         if 'duration_value' in self.df.columns:
-            tv_shows = self.df[self.df['type'] == 'TV Show']['duration_value'].dropna()
-            if not tv_shows.empty:
-                season_counts = tv_shows.value_counts().sort_index()
-                axes[1, 1].bar(season_counts.index, season_counts.values)
+            seasons, season_counts = self._sorted_counts('duration_value', mask=self._is_tv)
+            if len(seasons):
+                axes[1, 1].bar(seasons, season_counts)
                 axes[1, 1].set_title('TV Show Seasons Distribution')
                 axes[1, 1].set_xlabel('Number of Seasons')
                 axes[1, 1].set_ylabel('Number of Shows')
-        
-        plt.tight_layout()
-        
-        # Generate statistics
-        stats = {
-            'total_content': len(self.df),
-            'movies': len(self.df[self.df['type'] == 'Movie']),
-            'tv_shows': len(self.df[self.df['type'] == 'TV Show']),
-            'movie_percentage': (len(self.df[self.df['type'] == 'Movie']) / len(self.df)) * 100,
-            'avg_movie_duration': self.df[self.df['type'] == 'Movie']['duration_value'].mean() if 'duration_value' in self.df.columns else None
+    
+    def create_content_type_analysis(self) -> Tuple[Figure, Dict]:
+        """Create analysis of content types (Movies vs TV Shows)."""
+        stats = self._compute_content_type_stats()
+        return self._plot('content', stats), stats
+    
+    def _compute_temporal_stats(self) -> Dict:
+        """Compute temporal statistics of Netflix content."""
+        return {
+            'earliest_release': self.df['release_year'].min() if 'release_year' in self.df.columns else None,
+            'latest_release': self.df['release_year'].max() if 'release_year' in self.df.columns else None,
+            'first_added': self.df['date_added'].min() if 'date_added' in self.df.columns else None,
+            'last_added': self.df['date_added'].max() if 'date_added' in self.df.columns else None,
+            'avg_content_age': self.df['content_age_when_added'].mean() if 'content_age_when_added' in self.df.columns else None
         }
-        
-        return fig, stats
     
-    def create_temporal_analysis(self) -> Tuple[plt.Figure, Dict]:
-        """Create temporal analysis of Netflix content."""
-        fig, axes = plt.subplots(2, 2, figsize=FIGURE_SIZE)
-        fig.suptitle('Netflix Temporal Analysis', fontsize=16, fontweight='bold')
-        
+    def _draw_temporal(self, axes: np.ndarray, stats: Dict) -> None:
+        """Draw the temporal analysis panels on a 2x2 array of axes."""
         # Content added over time
         if 'date_added_year' in self.df.columns:
-            yearly_additions = self.df['date_added_year'].value_counts().sort_index()
+            yearly_additions = self._value_counts('date_added_year').sort_index()
             axes[0, 0].plot(yearly_additions.index, yearly_additions.values, marker='o')
             axes[0, 0].set_title('Content Added to Netflix by Year')
             axes[0, 0].set_xlabel('Year')
@@ -110,58 +427,59 @@ class NetflixAnalyzer:
         
         # Release year distribution
         if 'release_year' in self.df.columns:
-            release_years = self.df['release_year'].dropna()
-            axes[0, 1].hist(release_years, bins=50, alpha=0.7, edgecolor='black')
-            axes[0, 1].set_title('Content Release Year Distribution')
-            axes[0, 1].set_xlabel('Release Year')
-            axes[0, 1].set_ylabel('Frequency')
-            axes[0, 1].axvline(release_years.mean(), color='red', linestyle='--',
-                             label=f'Mean: {release_years.mean():.0f}')
-            axes[0, 1].legend()
+            release_years = self._masked_values('release_year')
+            if release_years.size:
+                mean_release = release_years.mean()
+                _plot_histogram(axes[0, 1], release_years, bins=50)
+                axes[0, 1].set_title('Content Release Year Distribution')
+                axes[0, 1].set_xlabel('Release Year')
+                axes[0, 1].set_ylabel('Frequency')
+                axes[0, 1].axvline(mean_release, color='red', linestyle='--',
+                                 label=f'Mean: {mean_release:.0f}')
+                axes[0, 1].legend()
         
         # Content age when added
         if 'content_age_when_added' in self.df.columns:
-            content_age = self.df['content_age_when_added'].dropna()
-            content_age = content_age[content_age >= 0]  # Filter out negative values
-            if not content_age.empty:
-                axes[1, 0].hist(content_age, bins=30, alpha=0.7, edgecolor='black')
+            content_age = self._float_values('content_age_when_added')
+            # One pass drops missing and negative ages (NaN fails the >= 0 test)
+            content_age = content_age[content_age >= 0]
+            if content_age.size:
+                mean_age = content_age.mean()
+                _plot_histogram(axes[1, 0], content_age, bins=30)
                 axes[1, 0].set_title('Content Age When Added to Netflix')
                 axes[1, 0].set_xlabel('Age (years)')
                 axes[1, 0].set_ylabel('Frequency')
-                axes[1, 0].axvline(content_age.mean(), color='red', linestyle='--',
-                                 label=f'Mean: {content_age.mean():.1f} years')
+                axes[1, 0].axvline(mean_age, color='red', linestyle='--',
+                                 label=f'Mean: {mean_age:.1f} years')
                 axes[1, 0].legend()
         
         # Decade analysis
         if 'decade' in self.df.columns:
-            decade_counts = self.df['decade'].value_counts().sort_index()
-            axes[1, 1].bar(decade_counts.index, decade_counts.values)
+            decades, decade_counts = self._sorted_counts('decade', step=10)
+            axes[1, 1].bar(decades, decade_counts)
             axes[1, 1].set_title('Content by Decade')
             axes[1, 1].set_xlabel('Decade')
             axes[1, 1].set_ylabel('Number of Titles')
             axes[1, 1].tick_params(axis='x', rotation=45)
-        
-        plt.tight_layout()
-        
-        # Generate statistics
-        stats = {
-            'earliest_release': self.df['release_year'].min() if 'release_year' in self.df.columns else None,
-            'latest_release': self.df['release_year'].max() if 'release_year' in self.df.columns else None,
-            'first_added': self.df['date_added'].min() if 'date_added' in self.df.columns else None,
-            'last_added': self.df['date_added'].max() if 'date_added' in self.df.columns else None,
-            'avg_content_age': self.df['content_age_when_added'].mean() if 'content_age_when_added' in self.df.columns else None
+    
+    def create_temporal_analysis(self) -> Tuple[Figure, Dict]:
+        """Create temporal analysis of Netflix content."""
+        stats = self._compute_temporal_stats()
+        return self._plot('temporal', stats), stats
+    
+    def _compute_geographic_stats(self) -> Dict:
+        """Compute geographic statistics of Netflix content."""
+        return {
+            'total_countries': len(self._value_counts('primary_country')) if 'primary_country' in self.df.columns else None,
+            'top_country': self._value_counts('primary_country').index[0] if 'primary_country' in self.df.columns and len(self._value_counts('primary_country')) else None,
+            'international_percentage': (self.df['is_international'].sum() / len(self.df)) * 100 if 'is_international' in self.df.columns else None
         }
-        
-        return fig, stats
     
-    def create_geographic_analysis(self) -> Tuple[plt.Figure, Dict]:
-        """Create geographic analysis of Netflix content."""
-        fig, axes = plt.subplots(2, 2, figsize=FIGURE_SIZE)
-        fig.suptitle('Netflix Geographic Analysis', fontsize=16, fontweight='bold')
-        
+    def _draw_geographic(self, axes: np.ndarray, stats: Dict) -> None:
+        """Draw the geographic analysis panels on a 2x2 array of axes."""
         # Top countries by content count
         if 'primary_country' in self.df.columns:
-            top_countries = self.df['primary_country'].value_counts().head(15)
+            top_countries = self._value_counts('primary_country').head(15)
             axes[0, 0].barh(range(len(top_countries)), top_countries.values)
             axes[0, 0].set_yticks(range(len(top_countries)))
             axes[0, 0].set_yticklabels(top_countries.index)
@@ -170,15 +488,15 @@ class NetflixAnalyzer:
         
         # International vs domestic content
         if 'is_international' in self.df.columns:
-            intl_counts = self.df['is_international'].value_counts()
+            intl_counts = self._value_counts('is_international')
             labels = ['Single Country', 'Multiple Countries']
             axes[0, 1].pie(intl_counts.values, labels=labels, autopct='%1.1f%%', startangle=90)
             axes[0, 1].set_title('International Co-productions')
         
         # Content type by top countries
         if 'primary_country' in self.df.columns and 'type' in self.df.columns:
-            top_5_countries = self.df['primary_country'].value_counts().head(5).index
-            country_type = self.df[self.df['primary_country'].isin(top_5_countries)].groupby(['primary_country', 'type']).size().unstack(fill_value=0)
+            top_5_countries = self._value_counts('primary_country').head(5).index
+            country_type = self._count_by_type('primary_country', top_5_countries)
             country_type.plot(kind='bar', ax=axes[1, 0], stacked=True)
             axes[1, 0].set_title('Content Type by Top 5 Countries')
             axes[1, 0].set_xlabel('Country')
@@ -188,32 +506,31 @@ class NetflixAnalyzer:
         
         # Country diversity over time
         if 'date_added_year' in self.df.columns and 'primary_country' in self.df.columns:
-            yearly_countries = self.df.groupby('date_added_year')['primary_country'].nunique()
+            yearly_countries = self._unique_per_year('primary_country')
             axes[1, 1].plot(yearly_countries.index, yearly_countries.values, marker='o')
             axes[1, 1].set_title('Country Diversity Over Time')
             axes[1, 1].set_xlabel('Year Added')
             axes[1, 1].set_ylabel('Number of Unique Countries')
             axes[1, 1].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        # Generate statistics
-        stats = {
-            'total_countries': self.df['primary_country'].nunique() if 'primary_country' in self.df.columns else None,
-            'top_country': self.df['primary_country'].mode().iloc[0] if 'primary_country' in self.df.columns and not self.df['primary_country'].mode().empty else None,
-            'international_percentage': (self.df['is_international'].sum() / len(self.df)) * 100 if 'is_international' in self.df.columns else None
+    
+    def create_geographic_analysis(self) -> Tuple[Figure, Dict]:
+        """Create geographic analysis of Netflix content."""
+        stats = self._compute_geographic_stats()
+        return self._plot('geographic', stats), stats
+    
+    def _compute_genre_stats(self) -> Dict:
+        """Compute genre statistics of Netflix content."""
+        return {
+            'total_unique_genres': len(self._value_counts('primary_genre')) if 'primary_genre' in self.df.columns else None,
+            'most_popular_genre': self._value_counts('primary_genre').index[0] if 'primary_genre' in self.df.columns and len(self._value_counts('primary_genre')) else None,
+            'avg_genres_per_title': self.df['genre_diversity'].mean() if 'genre_diversity' in self.df.columns else None
         }
-        
-        return fig, stats
     
-    def create_genre_analysis(self) -> Tuple[plt.Figure, Dict]:
-        """Create genre analysis of Netflix content."""
-        fig, axes = plt.subplots(2, 2, figsize=FIGURE_SIZE)
-        fig.suptitle('Netflix Genre Analysis', fontsize=16, fontweight='bold')
-        
+    def _draw_genre(self, axes: np.ndarray, stats: Dict) -> None:
+        """Draw the genre analysis panels on a 2x2 array of axes."""
         # Top genres
         if 'primary_genre' in self.df.columns:
-            top_genres = self.df['primary_genre'].value_counts().head(15)
+            top_genres = self._value_counts('primary_genre').head(15)
             axes[0, 0].barh(range(len(top_genres)), top_genres.values)
             axes[0, 0].set_yticks(range(len(top_genres)))
             axes[0, 0].set_yticklabels(top_genres.index)
@@ -222,16 +539,16 @@ class NetflixAnalyzer:
         
         # Genre diversity
         if 'genre_diversity' in self.df.columns:
-            diversity_counts = self.df['genre_diversity'].value_counts().sort_index()
-            axes[0, 1].bar(diversity_counts.index, diversity_counts.values)
+            diversity, diversity_counts = self._sorted_counts('genre_diversity')
+            axes[0, 1].bar(diversity, diversity_counts)
             axes[0, 1].set_title('Genre Diversity Distribution')
             axes[0, 1].set_xlabel('Number of Genres per Title')
             axes[0, 1].set_ylabel('Number of Titles')
         
         # Genre by content type
         if 'primary_genre' in self.df.columns and 'type' in self.df.columns:
-            top_genres_list = self.df['primary_genre'].value_counts().head(10).index
-            genre_type = self.df[self.df['primary_genre'].isin(top_genres_list)].groupby(['primary_genre', 'type']).size().unstack(fill_value=0)
+            top_genres_list = self._value_counts('primary_genre').head(10).index
+            genre_type = self._count_by_type('primary_genre', top_genres_list)
             genre_type.plot(kind='bar', ax=axes[1, 0], stacked=True)
             axes[1, 0].set_title('Content Type by Top 10 Genres')
             axes[1, 0].set_xlabel('Genre')
@@ -241,60 +558,84 @@ class NetflixAnalyzer:
         
         # Rating category distribution
         if 'rating_category' in self.df.columns:
-            rating_counts = self.df['rating_category'].value_counts()
+            rating_counts = self._value_counts('rating_category')
             axes[1, 1].pie(rating_counts.values, labels=rating_counts.index, autopct='%1.1f%%', startangle=90)
             axes[1, 1].set_title('Content by Rating Category')
-        
-        plt.tight_layout()
-        
-        # Generate statistics
-        stats = {
-            'total_unique_genres': self.df['primary_genre'].nunique() if 'primary_genre' in self.df.columns else None,
-            'most_popular_genre': self.df['primary_genre'].mode().iloc[0] if 'primary_genre' in self.df.columns and not self.df['primary_genre'].mode().empty else None,
-            'avg_genres_per_title': self.df['genre_diversity'].mean() if 'genre_diversity' in self.df.columns else None
-        }
-        
-        return fig, stats
+    
+    def create_genre_analysis(self) -> Tuple[Figure, Dict]:
+        """Create genre analysis of Netflix content."""
+        stats = self._compute_genre_stats()
+        return self._plot('genre', stats), stats
+    
+    def create_combined_dashboard(self) -> Tuple[Figure, Dict]:
+        """Create all four analyses in a single figure, plus the statistics of each."""
+        stats = {name: compute() for name, (compute, _) in self._analyses().items()}
+        stats['overview'] = self._compute_overview_stats()
+        return self._plot_all(stats), stats
+
+def _save_analysis(method, name: str, timestamp: str, fast_mode: bool = False) -> Tuple[Path, Dict]:
+    """
+    Render one analysis figure and save it as a PNG.
+    
+    Parameters:
+    method: Bound NetflixAnalyzer create_*_analysis method
+    name (str): Analysis name used in the file name
+    timestamp (str): Timestamp used in the file name
+    fast_mode (bool): Skip the tight bounding box pass
+    
+    Returns:
+    Tuple[Path, Dict]: Path to the saved figure and the analysis statistics
+    """
+    fig, stats = method()
+    path = OUTPUT_DIR / f"netflix_{name}_analysis_{timestamp}.png"
+    # Constrained layout already fits the figure, so fast mode skips the extra draw
+    # that measures a tight bounding box
+    fig.savefig(path, dpi=DPI, bbox_inches=None if fast_mode else 'tight', pil_kwargs=PNG_PIL_KWARGS)
+    return path, stats
 
-def create_netflix_dashboard(df: pd.DataFrame) -> Optional[Path]:
+def create_netflix_dashboard(df: pd.DataFrame, fast_mode: bool = FAST_DASHBOARD,
+                             return_stats: bool = False) -> Union[Optional[Path], Tuple[Optional[Path], Optional[Dict]]]:
     """
     Create a comprehensive dashboard with all Netflix analyses.
     
     Parameters:
     df (pd.DataFrame): Cleaned Netflix data
+    fast_mode (bool): Trade exact tight cropping for faster rendering
+    return_stats (bool): Also return the statistics behind the charts, so
+                         generate_analysis_report(df, stats=...) can reuse them
     
     Returns:
-    Path: Path to saved dashboard or None if error
+    Path: Path to saved dashboard or None if error. With return_stats, a
+    (path, stats) tuple instead, stats keyed 'overview', 'content',
+    'temporal', 'geographic', 'genre'; (None, None) if error
     """
     try:
         log_message("Creating Netflix analysis dashboard")
         
-        analyzer = NetflixAnalyzer(df)
-        
-        # Create all analyses
-        content_fig, content_stats = analyzer.create_content_type_analysis()
-        temporal_fig, temporal_stats = analyzer.create_temporal_analysis()
-        geographic_fig, geographic_stats = analyzer.create_geographic_analysis()
-        genre_fig, genre_stats = analyzer.create_genre_analysis()
-        
-        # Save individual figures
-        timestamp = analyzer.timestamp
-        
-        content_path = OUTPUT_DIR / f"netflix_content_analysis_{timestamp}.png"
-        content_fig.savefig(content_path, dpi=DPI, bbox_inches='tight')
-        plt.close(content_fig)
+        analyzer = NetflixAnalyzer(df, fast_mode=fast_mode)
         
-        temporal_path = OUTPUT_DIR / f"netflix_temporal_analysis_{timestamp}.png"
-        temporal_fig.savefig(temporal_path, dpi=DPI, bbox_inches='tight')
-        plt.close(temporal_fig)
-        
-        geographic_path = OUTPUT_DIR / f"netflix_geographic_analysis_{timestamp}.png"
-        geographic_fig.savefig(geographic_path, dpi=DPI, bbox_inches='tight')
-        plt.close(geographic_fig)
-        
-        genre_path = OUTPUT_DIR / f"netflix_genre_analysis_{timestamp}.png"
-        genre_fig.savefig(genre_path, dpi=DPI, bbox_inches='tight')
-        plt.close(genre_fig)
+        # Rendered one after another: Agg rasterizes under a process-wide lock and
+        # matplotlib drawing is not thread-safe, so worker threads gain nothing
+        analyses = {
+            'content': analyzer.create_content_type_analysis,
+            'temporal': analyzer.create_temporal_analysis,
+            'geographic': analyzer.create_geographic_analysis,
+            'genre': analyzer.create_genre_analysis
+        }
+        # rcParams are global, so fast-mode settings are applied once around all the figures
+        with plt.rc_context(FAST_MODE_RC) if fast_mode else nullcontext():
+            results = {
+                name: _save_analysis(method, name, analyzer.timestamp, fast_mode)
+                for name, method in analyses.items()
+            }
+        paths = {name: path for name, (path, _) in results.items()}
+        stats = {name: analysis_stats for name, (_, analysis_stats) in results.items()}
+        stats['overview'] = analyzer._compute_overview_stats()
+        
+        content_path = paths['content']
+        temporal_path = paths['temporal']
+        geographic_path = paths['geographic']
+        genre_path = paths['genre']
         
         log_success(f"Dashboard visualizations saved:")
         log_message(f"  - Content analysis: {content_path}")
@@ -302,18 +643,54 @@ def create_netflix_dashboard(df: pd.DataFrame) -> Optional[Path]:
         log_message(f"  - Geographic analysis: {geographic_path}")
         log_message(f"  - Genre analysis: {genre_path}")
         
+        if return_stats:
+            return content_path.parent, stats
         return content_path.parent
         
     except Exception as e:
         handle_error(f"Error creating dashboard: {e}")
-        return None
+        return (None, None) if return_stats else None
+
+def create_combined_netflix_dashboard(df: pd.DataFrame, fast_mode: bool = FAST_DASHBOARD,
+                                      return_stats: bool = False) -> Union[Optional[Path], Tuple[Optional[Path], Optional[Dict]]]:
+    """
+    Create the Netflix dashboard as one PNG holding all four analyses.
+    
+    Parameters:
+    df (pd.DataFrame): Cleaned Netflix data
+    fast_mode (bool): Skip the tight bounding box pass when saving
+    return_stats (bool): Also return the statistics of each analysis
+    
+    Returns:
+    Path: Path to the saved dashboard or None if error. With return_stats, a
+    (path, stats) tuple as returned by create_netflix_dashboard
+    """
+    try:
+        log_message("Creating combined Netflix analysis dashboard")
+        
+        analyzer = NetflixAnalyzer(df, fast_mode=fast_mode)
+        with plt.rc_context(FAST_MODE_RC) if fast_mode else nullcontext():
+            fig, stats = analyzer.create_combined_dashboard()
+            dashboard_path = OUTPUT_DIR / f"netflix_dashboard_{analyzer.timestamp}.png"
+            fig.savefig(dashboard_path, dpi=DPI, bbox_inches=None if fast_mode else 'tight', pil_kwargs=PNG_PIL_KWARGS)
+        
+        log_success(f"Combined dashboard saved: {dashboard_path}")
+        if return_stats:
+            return dashboard_path, stats
+        return dashboard_path
+        
+    except Exception as e:
+        handle_error(f"Error creating combined dashboard: {e}")
+        return (None, None) if return_stats else None
 
-def generate_analysis_report(df: pd.DataFrame) -> Optional[Path]:
+def generate_analysis_report(df: pd.DataFrame, stats: Optional[Dict] = None) -> Optional[Path]:
     """
     Generate a comprehensive text report of Netflix data analysis.
     
     Parameters:
     df (pd.DataFrame): Cleaned Netflix data
+    stats (Dict): Analysis statistics from create_netflix_dashboard(..., return_stats=True);
+    computed here when not given
     
     Returns:
     Path: Path to saved report or None if error
@@ -321,24 +698,35 @@ def generate_analysis_report(df: pd.DataFrame) -> Optional[Path]:
     try:
         log_message("Generating Netflix analysis report")
         
-        analyzer = NetflixAnalyzer(df)
-        timestamp = analyzer.timestamp
-        
-        # Generate all statistics
-        _, content_stats = analyzer.create_content_type_analysis()
-        _, temporal_stats = analyzer.create_temporal_analysis()
-        _, geographic_stats = analyzer.create_geographic_analysis()
-        _, genre_stats = analyzer.create_genre_analysis()
-        
-        # Create comprehensive report
-        report_content = f"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if stats is None:
+            # No figures are rendered for the report, only the statistics
+            analyzer = NetflixAnalyzer(df)
+            stats = {
+                'overview': analyzer._compute_overview_stats(),
+                'content': analyzer._compute_content_type_stats(),
+                'temporal': analyzer._compute_temporal_stats(),
+                'geographic': analyzer._compute_geographic_stats(),
+                'genre': analyzer._compute_genre_stats()
+            }
+        overview_stats = stats['overview']
+        content_stats = stats['content']
+        temporal_stats = stats['temporal']
+        geographic_stats = stats['geographic']
+        genre_stats = stats['genre']
+        
+        n_rows = overview_stats['total_content']
+        missing = overview_stats['missing_values']
+        
+        # Create comprehensive report; sections are collected and joined once at the end
+        report_parts = [f"""
 # Netflix Data Analysis Report
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Dataset Overview
-- Total Content: {len(df):,} titles
-- Data Quality: {df.isnull().sum().sum():,} missing values across all columns
-- Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB
+- Total Content: {n_rows:,} titles
+- Data Quality: {overview_stats['total_missing']:,} missing values across all columns
+- Memory Usage: {overview_stats['memory_mb']:.2f} MB
 
 ## Content Type Analysis
 - Total Movies: {content_stats['movies']:,} ({content_stats['movie_percentage']:.1f}%)
@@ -361,16 +749,15 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - Average Genres per Title: {genre_stats['avg_genres_per_title']:.1f} (if available)
 
 ## Data Quality Summary
-"""
+"""]
         
         # Add data quality details
-        for column in df.columns:
-            missing_count = df[column].isnull().sum()
-            missing_pct = (missing_count / len(df)) * 100
-            if missing_count > 0:
-                report_content += f"- {column}: {missing_count:,} missing ({missing_pct:.1f}%)\n"
+        report_parts.extend(
+            f"- {column}: {missing_count:,} missing ({missing_count / n_rows * 100:.1f}%)\n"
+            for column, missing_count in missing.items() if missing_count > 0
+        )
         
-        report_content += f"""
+        report_parts.append(f"""
 ## Key Insights
 1. Netflix has a {'movie' if content_stats['movies'] > content_stats['tv_shows'] else 'TV show'}-heavy catalog
 2. The platform shows {'recent' if temporal_stats['avg_content_age'] and temporal_stats['avg_content_age'] < 5 else 'diverse age'} content preferences
@@ -385,7 +772,8 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ---
 Report generated by Netflix Data Engineering Pipeline
-"""
+""")
+        report_content = ''.join(report_parts)
         
         # Save report
         report_path = OUTPUT_DIR / f"netflix_analysis_report_{timestamp}.md"
@@ -399,16 +787,8 @@ Report generated by Netflix Data Engineering Pipeline
         handle_error(f"Error generating analysis report: {e}")
         return None
 
-def create_sql_queries_examples() -> Path:
-    """
-    Create a file with example SQL queries for the Netflix database.
-    
-    Returns:
-    Path: Path to saved SQL queries file
-    """
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
-    sql_queries = """
+# Example queries shipped with every run; encoded once at import
+SQL_QUERIES_EXAMPLES = """
 -- Netflix Data Analysis - Example SQL Queries
 -- Generated by Netflix Data Engineering Pipeline
 
@@ -529,10 +909,19 @@ WHERE date_added >= '2020-01-01'
 ORDER BY date_added DESC 
 LIMIT 20;
 """
+_SQL_QUERIES_BYTES = SQL_QUERIES_EXAMPLES.encode('utf-8')
+
+def create_sql_queries_examples() -> Path:
+    """
+    Create a file with example SQL queries for the Netflix database.
+    
+    Returns:
+    Path: Path to saved SQL queries file
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
     queries_path = OUTPUT_DIR / f"netflix_sql_queries_{timestamp}.sql"
-    with open(queries_path, 'w', encoding='utf-8') as f:
-        f.write(sql_queries)
+    queries_path.write_bytes(_SQL_QUERIES_BYTES)
     
     log_success(f"SQL queries examples saved: {queries_path}")
     return queries_path
@@ -0,0 +1,57 @@
+"""
+Shared fixtures: a small synthetic Netflix CSV written to a temporary directory.
+"""
+
+import csv
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+NETFLIX_COLUMNS = [
+    'show_id', 'type', 'title', 'director', 'cast', 'country',
+    'date_added', 'release_year', 'rating', 'duration', 'listed_in', 'description'
+]
+
+COUNTRIES = ['United States', 'India', 'Brazil, Mexico', 'United Kingdom']
+GENRES = ['Dramas, International Movies', 'Comedies', 'Documentaries', 'Kids\' TV, Comedies']
+RATINGS = ['TV-MA', 'PG-13', 'TV-Y', 'R', 'TV-14']
+MONTHS = ['January', 'March', 'June', 'September', 'December']
+
+def netflix_row(i: int, **overrides) -> Dict[str, str]:
+    """A valid synthetic title; i selects the variant, overrides replace fields."""
+    is_movie = i % 3 != 0
+    row = {
+        'show_id': f's{i}',
+        'type': 'Movie' if is_movie else 'TV Show',
+        'title': f'Title {i}',
+        'director': f'Director {i % 4}',
+        'cast': 'Actor A, Actor B' if i % 2 else 'Actor C',
+        'country': COUNTRIES[i % len(COUNTRIES)],
+        'date_added': f'{MONTHS[i % len(MONTHS)]} {i % 28 + 1}, {2015 + i % 7}',
+        'release_year': str(1990 + i % 30),
+        'rating': RATINGS[i % len(RATINGS)],
+        'duration': f'{80 + i % 60} min' if is_movie else f'{i % 4 + 1} Seasons',
+        'listed_in': GENRES[i % len(GENRES)],
+        'description': f'A synthetic description of title number {i}.'
+    }
+    row.update(overrides)
+    return row
+
+@pytest.fixture
+def make_netflix_csv(tmp_path):
+    """Return a function writing rows (default: 30 synthetic titles) to a CSV in tmp_path."""
+    def write(rows: Optional[List[Dict[str, str]]] = None, name: str = 'netflix_titles.csv') -> Path:
+        if rows is None:
+            rows = [netflix_row(i) for i in range(30)]
+        path = tmp_path / name
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=NETFLIX_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+    return write
@@ -0,0 +1,102 @@
+"""
+Tests for reading the Netflix CSV.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+import extract
+from conftest import netflix_row
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow"])
+def test_blank_release_year_is_read_as_missing(monkeypatch, make_netflix_csv, engine):
+    """A row without release_year doesn't fail the extract; the year is just missing."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(extract, "CSV_ENGINE", engine)
+    monkeypatch.setattr(extract, "PARQUET_CACHE", False)
+    csv_path = make_netflix_csv([netflix_row(i, release_year='' if i == 2 else str(2000 + i))
+                                 for i in range(6)])
+
+    df = extract.extract_netflix_data(csv_path)
+
+    assert df is not None
+    assert len(df) == 6
+    assert df['release_year'].isna().tolist() == [False, False, True, False, False, False]
+
+def test_blank_release_year_in_chunked_read(make_netflix_csv):
+    """The chunked reader applies the same schema and tolerates a blank year too."""
+    csv_path = make_netflix_csv([netflix_row(i, release_year='' if i == 3 else str(2000 + i))
+                                 for i in range(6)])
+
+    chunks = list(extract.iter_netflix_data(csv_path, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2]
+    assert int(pd.concat(chunks)['release_year'].isna().sum()) == 1
+
+@pytest.fixture
+def parquet_cache(monkeypatch, tmp_path):
+    """Enable the Parquet cache in a temporary cache directory."""
+    pytest.importorskip("pyarrow")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(extract, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(extract, "PARQUET_CACHE", True)
+    return cache_dir
+
+def _spy_cache_loads(monkeypatch) -> list:
+    """Record the result of every cache lookup: a frame on a hit, None on a miss."""
+    results = []
+    load = extract._load_parquet_cache
+    def spy(*args, **kwargs):
+        results.append(load(*args, **kwargs))
+        return results[-1]
+    monkeypatch.setattr(extract, "_load_parquet_cache", spy)
+    return results
+
+def test_parquet_cache_hit_equals_fresh_parse(monkeypatch, make_netflix_csv, parquet_cache):
+    """A cache hit returns the same frame as parsing the CSV, dtypes included."""
+    csv_path = make_netflix_csv()
+    lookups = _spy_cache_loads(monkeypatch)
+
+    fresh = extract.extract_netflix_data(csv_path)
+    cached = extract.extract_netflix_data(csv_path)
+
+    assert lookups[0] is None and lookups[1] is not None
+    assert list(parquet_cache.iterdir())
+    pd.testing.assert_frame_equal(cached, fresh, check_dtype=True)
+
+def test_parquet_cache_misses_when_csv_changes_with_older_mtime(monkeypatch, make_netflix_csv, parquet_cache):
+    """Replacing the CSV with other content misses the cache even if its mtime is older."""
+    csv_path = make_netflix_csv()
+    extract.extract_netflix_data(csv_path)
+    mtime_ns = csv_path.stat().st_mtime_ns
+
+    # Like cp -p or extracting an archive: new content, older timestamp
+    make_netflix_csv([netflix_row(i) for i in range(20)])
+    os.utime(csv_path, ns=(mtime_ns - 10**10, mtime_ns - 10**10))
+    lookups = _spy_cache_loads(monkeypatch)
+
+    df = extract.extract_netflix_data(csv_path)
+
+    assert lookups == [None]
+    assert len(df) == 20
+
+@pytest.mark.parametrize("setting, value", [
+    ("NETFLIX_SCHEMA", {**extract.NETFLIX_SCHEMA, 'type': 'string[pyarrow]'}),
+    ("CSV_ENGINE", "pyarrow"),
+])
+def test_parquet_cache_misses_when_reader_settings_change(monkeypatch, make_netflix_csv, parquet_cache,
+                                                          setting, value):
+    """Changing the schema or the CSV engine misses the cache for an unchanged CSV."""
+    csv_path = make_netflix_csv()
+    extract.extract_netflix_data(csv_path)
+
+    monkeypatch.setattr(extract, setting, value)
+    lookups = _spy_cache_loads(monkeypatch)
+    df = extract.extract_netflix_data(csv_path)
+
+    assert lookups == [None]
+    assert df is not None
@@ -0,0 +1,120 @@
+"""
+Tests for the optional accelerated code paths.
+
+Each backend from requirements-fast.txt is compared with the numpy, pandas
+or PyArrow fallback that runs when it is not installed. A test is skipped
+when its backend is missing.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Histogram inputs: integer years hit the upper edge exactly, the random
+# floats don't, and a constant array exercises the widened range
+HISTOGRAM_CASES = [
+    np.arange(1925, 2022, dtype=np.float64).repeat(3),
+    np.random.default_rng(0).normal(100.0, 25.0, 5000),
+    np.full(10, 7.0),
+]
+
+def _as_python(series: pd.Series) -> list:
+    """Column values as Python objects with None for missing, for cross-dtype comparison."""
+    return [None if pd.isna(value) else value for value in series.astype(object)]
+
+@pytest.mark.parametrize("values", HISTOGRAM_CASES)
+def test_fast_histogram_matches_bincount(monkeypatch, values):
+    """fast-histogram counts match the bincount fallback and np.histogram."""
+    pytest.importorskip("fast_histogram")
+    import visualizations
+
+    counts, edges = visualizations._uniform_histogram(values, 20)
+
+    monkeypatch.setattr(visualizations, "histogram1d", None)
+    monkeypatch.setattr(visualizations, "njit", None)
+    fallback_counts, fallback_edges = visualizations._uniform_histogram(values, 20)
+
+    np.testing.assert_array_equal(counts, fallback_counts)
+    np.testing.assert_array_equal(edges, fallback_edges)
+    np.testing.assert_array_equal(counts, np.histogram(values, bins=20)[0])
+
+@pytest.mark.parametrize("values", HISTOGRAM_CASES)
+def test_numba_histogram_matches_bincount(monkeypatch, values):
+    """The Numba histogram kernel matches the bincount fallback and np.histogram."""
+    pytest.importorskip("numba")
+    import visualizations
+
+    monkeypatch.setattr(visualizations, "histogram1d", None)
+    counts, _ = visualizations._uniform_histogram(values, 20)
+
+    monkeypatch.setattr(visualizations, "njit", None)
+    fallback_counts, _ = visualizations._uniform_histogram(values, 20)
+
+    np.testing.assert_array_equal(counts, fallback_counts)
+    np.testing.assert_array_equal(counts, np.histogram(values, bins=20)[0])
+
+def test_numba_year_features_matches_numpy(monkeypatch):
+    """The fused year/decade kernel matches the numpy fallback, NaN included."""
+    pytest.importorskip("numba")
+    import transform
+
+    years = np.array([1899, 1900, 1925, 1999, 2000, 2026, 2027, np.nan], dtype=np.float64)
+    out_years, out_decades = transform._year_features(years, 1900, 2026)
+
+    monkeypatch.setattr(transform, "njit", None)
+    fallback_years, fallback_decades = transform._year_features(years, 1900, 2026)
+
+    np.testing.assert_array_equal(out_years, fallback_years)
+    np.testing.assert_array_equal(out_decades, fallback_decades)
+
+def test_numba_count_items_matches_arrow(monkeypatch):
+    """Counting commas in the Arrow buffers matches pyarrow.compute, sliced arrays included."""
+    pytest.importorskip("numba")
+    pa = pytest.importorskip("pyarrow")
+    import transform
+
+    series = pd.Series(["Drama", "Drama, Comedy", None, "", ",,", "Ação, Comédia, Drama"],
+                       dtype=pd.StringDtype("pyarrow"))
+    counts = transform._count_items(series)
+
+    monkeypatch.setattr(transform, "njit", None)
+    fallback_counts = transform._count_items(series)
+
+    pd.testing.assert_series_equal(counts, fallback_counts)
+
+    # A sliced array starts at a non-zero offset into the shared buffers
+    sliced = pa.array(series, from_pandas=True).slice(2)
+    np.testing.assert_array_equal(transform._count_items_buffers(sliced), fallback_counts.to_numpy()[2:])
+
+def test_polars_reader_matches_pandas(monkeypatch, tmp_path):
+    """The Polars CSV engine reads the same values as the pandas engine."""
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    import extract
+
+    csv_path = tmp_path / "titles.csv"
+    csv_path.write_text(
+        "show_id,type,title,country,release_year\n"
+        's1,Movie,"Title, with comma",Brazil,2020\n'
+        "s2,TV Show,Ação,,1999\n"
+        's3,Movie,"Quote ""inside""","United States, Canada",2021\n',
+        encoding="utf-8"
+    )
+
+    with open(csv_path, "rb") as fh:
+        monkeypatch.setattr(extract, "CSV_ENGINE", "polars")
+        polars_df = extract._read_csv(fh)
+        monkeypatch.setattr(extract, "CSV_ENGINE", "pandas")
+        pandas_df = extract._read_csv(fh)
+
+    # A failed Polars read would have fallen back to pandas and its dtypes
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in polars_df.dtypes)
+    assert list(polars_df.columns) == list(pandas_df.columns)
+    for column in pandas_df.columns:
+        assert _as_python(polars_df[column]) == _as_python(pandas_df[column]), column
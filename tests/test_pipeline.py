@@ -0,0 +1,66 @@
+"""
+Tests for the chunked streaming mode of the pipeline, with the database calls mocked.
+"""
+
+import pandas as pd
+import pytest
+
+import extract
+import pipeline
+from conftest import netflix_row
+
+@pytest.fixture
+def database(monkeypatch):
+    """Replace the load helpers used by the pipeline with recorders."""
+    calls = {'loads': [], 'replaced': [], 'dropped': []}
+
+    def load_to_postgres(df, table_name, if_exists='replace', write_outputs=True):
+        calls['loads'].append((table_name, if_exists, df.copy()))
+        return True
+
+    monkeypatch.setattr(pipeline, "load_to_postgres", load_to_postgres)
+    monkeypatch.setattr(pipeline, "replace_table",
+                        lambda staging, table: calls['replaced'].append((staging, table)) or True)
+    monkeypatch.setattr(pipeline, "drop_table", lambda table: calls['dropped'].append(table) or True)
+    monkeypatch.setattr(pipeline, "get_table_info", lambda table: None)
+    monkeypatch.setattr(pipeline, "remove_parquet_copy", lambda table: None)
+    return calls
+
+def test_duplicates_across_chunk_boundary_are_dropped(database, make_netflix_csv):
+    """Rows repeated in a later chunk, including right across a boundary, are loaded once."""
+    rows = [netflix_row(i) for i in range(10)]
+    # Chunks of 4: s3 ends the first chunk and is repeated first in the second,
+    # s1 reappears two chunks later
+    rows = rows[:4] + [rows[3]] + rows[4:7] + [rows[1]] + rows[7:]
+    csv_path = make_netflix_csv(rows)
+
+    etl = pipeline.NetflixETLPipeline(csv_path, table_name='titles', chunk_size=4)
+    loaded_rows = etl._load_chunks('titles_staging')
+
+    loaded = pd.concat([df for _, _, df in database['loads']])
+    assert etl.raw_data_rows == 12
+    assert loaded_rows == 10
+    assert sorted(loaded['show_id'].astype(str)) == sorted(f's{i}' for i in range(10))
+    assert [(table, if_exists) for table, if_exists, _ in database['loads']] == [
+        ('titles_staging', 'replace'), ('titles_staging', 'append'), ('titles_staging', 'append')
+    ]
+    assert etl.chunk_summary['total_linhas'] == 10
+
+def test_mid_stream_error_drops_staging_and_keeps_table(database, monkeypatch, make_netflix_csv):
+    """A read error after the first chunk fails the run without replacing the target table."""
+    csv_path = make_netflix_csv([netflix_row(i) for i in range(8)])
+    read_chunks = extract._iter_csv_chunks
+
+    def failing_chunks(*args, **kwargs):
+        chunks = read_chunks(*args, **kwargs)
+        yield next(iter(chunks))
+        raise OSError("disk read failed")
+
+    monkeypatch.setattr(extract, "_iter_csv_chunks", failing_chunks)
+
+    etl = pipeline.NetflixETLPipeline(csv_path, table_name='titles', chunk_size=4)
+    assert etl._process_in_chunks() is False
+
+    assert len(database['loads']) == 1
+    assert database['replaced'] == []
+    assert database['dropped'] == ['titles_staging']
@@ -0,0 +1,56 @@
+"""
+Smoke tests for the dashboards, rendered on the Agg backend from a tiny synthetic frame.
+"""
+
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+
+import pytest
+
+import visualizations
+from extract import extract_netflix_data
+from transform import transform_netflix_data
+
+@pytest.fixture
+def netflix_frame(monkeypatch, make_netflix_csv):
+    """Transformed synthetic titles, with the Parquet cache disabled."""
+    import extract
+    monkeypatch.setattr(extract, "PARQUET_CACHE", False)
+    return transform_netflix_data(extract_netflix_data(make_netflix_csv()))
+
+@pytest.fixture
+def output_dir(monkeypatch, tmp_path):
+    """Write the dashboard files to a temporary directory."""
+    out = tmp_path / "output"
+    out.mkdir()
+    monkeypatch.setattr(visualizations, "OUTPUT_DIR", out)
+    return out
+
+def test_dashboard_returns_path_by_default(netflix_frame, output_dir):
+    """Without return_stats the dashboard returns just its directory, as before."""
+    path = visualizations.create_netflix_dashboard(netflix_frame)
+
+    assert isinstance(path, Path)
+    assert len(list(output_dir.glob("netflix_*_analysis_*.png"))) == 4
+
+def test_dashboard_returns_stats_for_the_report(netflix_frame, output_dir):
+    """With return_stats the statistics come back and feed the analysis report."""
+    path, stats = visualizations.create_netflix_dashboard(netflix_frame, return_stats=True)
+
+    assert isinstance(path, Path)
+    assert set(stats) == {'overview', 'content', 'temporal', 'geographic', 'genre'}
+    assert visualizations.generate_analysis_report(netflix_frame, stats=stats).exists()
+
+@pytest.mark.parametrize("fast_mode", [False, True])
+def test_combined_dashboard_writes_png(netflix_frame, output_dir, fast_mode):
+    """The single-figure dashboard renders all four analyses into one PNG."""
+    path, stats = visualizations.create_combined_netflix_dashboard(
+        netflix_frame, fast_mode=fast_mode, return_stats=True
+    )
+
+    assert path is not None and path.exists()
+    assert path.read_bytes()[:8] == b'\x89PNG\r\n\x1a\n'
+    assert list(output_dir.glob("*.png")) == [path]
+    assert set(stats) == {'overview', 'content', 'temporal', 'geographic', 'genre'}